@@ -0,0 +1,29 @@
+"""Numba kernels for background_generator.
+
+Kept in their own module so numba/LLVM are only loaded the first time a
+kernel is needed, not on every import of the video stack.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def gradient_with_noise(out, ramp, t_field, noise_scale):
+    """Write ramp colors for `t_field` plus gaussian grain into `out`."""
+    height, width = t_field.shape
+    last = ramp.shape[0] - 1
+    for y in prange(height):
+        for x in range(width):
+            i = int(t_field[y, x] * last)
+            if i < 0:
+                i = 0
+            elif i > last:
+                i = last
+            for c in range(3):
+                v = ramp[i, c] + noise_scale * np.random.standard_normal()
+                if v < 0.0:
+                    v = 0.0
+                elif v > 255.0:
+                    v = 255.0
+                out[y, x, c] = np.uint8(v)
@@ -1,9 +1,12 @@
 """Generate beautiful gradient backgrounds for poetry videos with TikTok-style effects."""
 
 import numpy as np
-from PIL import Image
 import random
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 # Elegant color palettes for poetry videos (originals)
@@ -51,12 +54,28 @@ COLOR_PALETTES = {
     ],
 }
 
+# Palettes pre-converted to float32 arrays so gradient code only indexes them
+_PALETTE_ARRAYS = {
+    name: np.asarray(colors, dtype=np.float32)
+    for name, colors in COLOR_PALETTES.items()
+}
+
+# Palette names for random selection, preferring TikTok palettes
+_ALL_PALETTES = list(COLOR_PALETTES)
+_TIKTOK_PALETTES = [k for k in _ALL_PALETTES if k.startswith("tiktok_")]
+
+# Resolution of the 1D palette lookup table used by distance-field gradients
+_RAMP_SIZE = 1024
+
+_RNG = np.random.default_rng()
+
 
 def create_gradient_background(
     resolution: tuple,
     palette_name: Optional[str] = None,
     direction: str = "diagonal",
     noise: bool = True,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """Create a smooth gradient background.
 
@@ -65,125 +84,160 @@ def create_gradient_background(
         palette_name: Name of color palette from COLOR_PALETTES. If None, random.
         direction: "vertical", "horizontal", "diagonal", "radial"
         noise: Add subtle grain/texture overlay
+        out: Optional preallocated (H, W, 3) uint8 buffer to write into, so
+            callers rendering many backgrounds can reuse the same memory
 
     Returns:
-        numpy array (H, W, 3) uint8 RGB image
+        numpy array (H, W, 3) uint8 RGB image (`out` itself if provided)
     """
     width, height = resolution
 
     if palette_name is None or palette_name not in COLOR_PALETTES:
         # Prefer TikTok palettes for better visual impact
-        tiktok_palettes = [k for k in COLOR_PALETTES.keys() if k.startswith("tiktok_")]
-        palette_name = random.choice(
-            tiktok_palettes if tiktok_palettes else list(COLOR_PALETTES.keys())
-        )
-
-    colors = COLOR_PALETTES[palette_name]
-
-    # Create gradient
-    if direction == "vertical":
-        gradient = _vertical_gradient(width, height, colors)
-    elif direction == "radial":
-        gradient = _radial_gradient(width, height, colors)
-    else:  # diagonal
-        gradient = _diagonal_gradient(width, height, colors)
-
-    # Add subtle noise texture
-    if noise:
-        gradient = _add_noise(gradient, intensity=0.03)
-
-    return gradient
-
-
-def _vertical_gradient(width: int, height: int, colors: list) -> np.ndarray:
-    """Create vertical gradient."""
-    img = np.zeros((height, width, 3), dtype=np.uint8)
-    num_colors = len(colors)
+        palette_name = get_random_palette()
 
-    for y in range(height):
-        t = y / (height - 1) * (num_colors - 1)
-        idx = int(t)
-        frac = t - idx
-
-        if idx >= num_colors - 1:
-            color = colors[-1]
+    if direction in ("vertical", "horizontal"):
+        colors = _PALETTE_ARRAYS[palette_name]
+        if direction == "vertical":
+            gradient = _vertical_gradient(width, height, colors)
         else:
-            c1 = np.array(colors[idx])
-            c2 = np.array(colors[idx + 1])
-            color = c1 * (1 - frac) + c2 * frac
+            gradient = _horizontal_gradient(width, height, colors)
+    else:
+        # Distance-field gradients: radial from the center, otherwise diagonal
+        kind = "radial" if direction == "radial" else "diagonal"
+        field = _distance_field(width, height, kind)
+        ramp = _palette_ramp(palette_name)
+        if noise:
+            # Gather, add grain and clip in a single pass; numba is imported
+            # here so merely importing this module stays cheap
+            from ._background_kernels import gradient_with_noise
+
+            if out is None:
+                out = np.empty((height, width, 3), dtype=np.uint8)
+            gradient_with_noise(out, ramp, field, 0.03 * 255)
+            return out
+        gradient = ramp[_ramp_indices(field)]
+
+    # Add subtle noise texture (this also materializes broadcast views)
+    if noise:
+        return _add_noise(gradient, intensity=0.03, out=out)
 
-        img[y, :, :] = color
+    if out is not None:
+        np.copyto(out, gradient)
+        return out
+    return np.ascontiguousarray(gradient)
 
-    return img
 
+def _interpolate_colors(t: np.ndarray, colors_arr: np.ndarray) -> np.ndarray:
+    """Linearly interpolate palette colors at positions `t` in [0, len-1].
 
-def _diagonal_gradient(width: int, height: int, colors: list) -> np.ndarray:
-    """Create diagonal gradient (top-left to bottom-right)."""
-    img = np.zeros((height, width, 3), dtype=np.uint8)
-    num_colors = len(colors)
-    max_dist = np.sqrt(width**2 + height**2)
+    Returns a float32 array with shape `t.shape + (3,)`.
+    """
+    num_colors = len(colors_arr)
+    t = np.clip(t, 0, num_colors - 1)
+    idx = np.minimum(t.astype(np.int32), max(num_colors - 2, 0))
+    nxt = np.minimum(idx + 1, num_colors - 1)
+    frac = (t - idx)[..., None]
+    return colors_arr[idx] * (1 - frac) + colors_arr[nxt] * frac
 
-    for y in range(height):
-        for x in range(width):
-            dist = np.sqrt(x**2 + y**2)
-            t = (dist / max_dist) * (num_colors - 1)
-            idx = int(t)
-            frac = t - idx
 
-            if idx >= num_colors - 1:
-                color = colors[-1]
-            else:
-                c1 = np.array(colors[idx])
-                c2 = np.array(colors[idx + 1])
-                color = c1 * (1 - frac) + c2 * frac
+def _build_ramp(colors_arr: np.ndarray, size: int = _RAMP_SIZE) -> np.ndarray:
+    """Tabulate the full palette blend as a (size, 3) uint8 lookup table."""
+    t = np.linspace(0, len(colors_arr) - 1, size, dtype=np.float32)
+    return _interpolate_colors(t, colors_arr).astype(np.uint8)
 
-            img[y, x, :] = color
 
-    return img
+def _ramp_indices(t: np.ndarray, size: int = _RAMP_SIZE) -> np.ndarray:
+    """Map normalized positions `t` in [0, 1] to ramp indices."""
+    return np.clip((t * (size - 1)).astype(np.int32), 0, size - 1)
 
 
-def _radial_gradient(width: int, height: int, colors: list) -> np.ndarray:
-    """Create radial gradient from center."""
-    img = np.zeros((height, width, 3), dtype=np.uint8)
-    num_colors = len(colors)
+def _vertical_gradient(width: int, height: int, colors: np.ndarray) -> np.ndarray:
+    """Create vertical gradient."""
+    colors_arr = np.asarray(colors, dtype=np.float32)
+    t = np.linspace(0, len(colors_arr) - 1, height, dtype=np.float32)
+    column = _interpolate_colors(t, colors_arr).astype(np.uint8)
+    # Read-only view; callers materialize it when adding noise
+    return np.broadcast_to(column[:, None, :], (height, width, 3))
+
+
+def _horizontal_gradient(width: int, height: int, colors: np.ndarray) -> np.ndarray:
+    """Create horizontal gradient (left to right)."""
+    colors_arr = np.asarray(colors, dtype=np.float32)
+    t = np.linspace(0, len(colors_arr) - 1, width, dtype=np.float32)
+    row = _interpolate_colors(t, colors_arr).astype(np.uint8)
+    # Read-only view; callers materialize it when adding noise
+    return np.broadcast_to(row[None, :, :], (height, width, 3))
+
+
+def _diagonal_field(width: int, height: int) -> np.ndarray:
+    """Normalized distance from the top-left corner, as float32 in [0, 1]."""
+    max_dist_sq = max(width**2 + height**2, 1)
+
+    # Normalize in squared-distance space, then take one in-place sqrt.
+    # float32 axes keep the HxW field at 4 bytes/pixel (exact below 2**24).
+    y = np.arange(height, dtype=np.float32)[:, None]
+    x = np.arange(width, dtype=np.float32)
+    t = x * x + y * y
+    t *= 1.0 / max_dist_sq
+    np.sqrt(t, out=t)
+    return t
+
+
+def _radial_field(width: int, height: int) -> np.ndarray:
+    """Normalized distance from the image center, as float32 in [0, 1]."""
     cx, cy = width // 2, height // 2
-    max_dist = np.sqrt(cx**2 + cy**2)
+    max_dist_sq = max(cx**2 + cy**2, 1)
 
-    for y in range(height):
-        for x in range(width):
-            dx = x - cx
-            dy = y - cy
-            dist = np.sqrt(dx**2 + dy**2)
-            t = (dist / max_dist) * (num_colors - 1)
-            idx = int(t)
-            frac = t - idx
+    dy = np.arange(height, dtype=np.float32)[:, None] - cy
+    dx = np.arange(width, dtype=np.float32) - cx
+    t = dx * dx + dy * dy
+    t *= 1.0 / max_dist_sq
+    np.sqrt(t, out=t)
+    return t
 
-            if idx >= num_colors - 1:
-                color = colors[-1]
-            else:
-                c1 = np.array(colors[idx])
-                c2 = np.array(colors[idx + 1])
-                color = c1 * (1 - frac) + c2 * frac
 
-            img[y, x, :] = color
+@lru_cache(maxsize=4)
+def _distance_field(width: int, height: int, kind: str) -> np.ndarray:
+    """Cached, read-only distance field for a given size and gradient kind.
 
-    return img
+    Kept small on purpose: a 1080x1920 field is ~8 MB.
+    """
+    if kind == "radial":
+        field = _radial_field(width, height)
+    else:
+        field = _diagonal_field(width, height)
+    field.flags.writeable = False
+    return field
 
 
-def _add_noise(img: np.ndarray, intensity: float = 0.03) -> np.ndarray:
-    """Add subtle grain texture."""
-    noise = np.random.normal(0, intensity * 255, img.shape)
-    noisy = img.astype(np.float32) + noise
-    noisy = np.clip(noisy, 0, 255).astype(np.uint8)
-    return noisy
+@lru_cache(maxsize=None)
+def _palette_ramp(palette_name: str) -> np.ndarray:
+    """Cached, read-only ramp lookup table for a named palette."""
+    ramp = _build_ramp(_PALETTE_ARRAYS[palette_name])
+    ramp.flags.writeable = False
+    return ramp
+
+
+def _add_noise(
+    img: np.ndarray, intensity: float = 0.03, out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Add subtle grain texture, writing into `out` when given."""
+    # Single float32 buffer reused for noise, sum and clip
+    noise = np.empty(img.shape, dtype=np.float32)
+    _RNG.standard_normal(out=noise, dtype=np.float32)
+    noise *= intensity * 255
+    np.add(noise, img, out=noise)
+    np.clip(noise, 0, 255, out=noise)
+    if out is None:
+        return noise.astype(np.uint8)
+    np.copyto(out, noise, casting="unsafe")
+    return out
 
 
 def get_random_palette() -> str:
     """Return a random palette name, preferring TikTok palettes."""
-    tiktok_palettes = [k for k in COLOR_PALETTES.keys() if k.startswith("tiktok_")]
-    return random.choice(
-        tiktok_palettes if tiktok_palettes else list(COLOR_PALETTES.keys())
-    )
+    return random.choice(_TIKTOK_PALETTES or _ALL_PALETTES)
 
 
 def create_zoomed_background(
@@ -191,7 +245,7 @@ def create_zoomed_background(
     palette_name: Optional[str] = None,
     zoom_factor: float = 1.1,
     pan_direction: str = "up",
-) -> Image.Image:
+) -> "Image.Image":
     """Create a gradient background with zoom effect for Ken Burns style.
 
     Args:
@@ -203,17 +257,24 @@ def create_zoomed_background(
     Returns:
         PIL Image ready for zoom/pan animation
     """
+    from PIL import Image
+
     # Create larger image for zoom
     width, height = resolution
     big_width = int(width * zoom_factor)
     big_height = int(height * zoom_factor)
 
-    # Generate gradient at larger size
-    gradient = create_gradient_background(
-        (big_width, big_height),
+    # Gradients are low-frequency: render at reduced size and upsample,
+    # then add the grain at full resolution so it stays sharp
+    small = create_gradient_background(
+        (max(big_width // 4, 1), max(big_height // 4, 1)),
         palette_name=palette_name,
         direction="diagonal",
-        noise=True,
+        noise=False,
+    )
+    upscaled = Image.fromarray(small).resize(
+        (big_width, big_height), Image.Resampling.BILINEAR
     )
+    gradient = _add_noise(np.asarray(upscaled), intensity=0.03)
 
     return Image.fromarray(gradient)
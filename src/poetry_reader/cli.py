@@ -1,7 +1,6 @@
 import typer
 from pathlib import Path
 from typing import Optional
-from .generate_videos import main as generate_main
 import logging
 
 # Configure logging to show INFO messages
@@ -14,6 +13,20 @@ logging.basicConfig(
 app = typer.Typer(help="Poetry Reader CLI")
 
 
+def _load_drive_config(drive_config: Path, *required: str) -> dict:
+    """Load and validate the Drive config, exiting with a clear error if invalid.
+
+    `required` lists the extra "section.key" entries the command reads.
+    """
+    from .utils import load_drive_config
+
+    try:
+        return load_drive_config(drive_config, required)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(1)
+
+
 @app.command()
 def generate(
     input_dir: Path = typer.Argument(
@@ -58,6 +71,10 @@ def generate(
         "1.7B",
         help="Tamaño del modelo TTS: '1.7B' (calidad alta, ~8GB VRAM) o '0.6B' (más rápido, ~3GB VRAM)",
     ),
+    tts_precision: str = typer.Option(
+        "auto",
+        help="Precisión del modelo TTS: 'auto' (bf16 en CUDA, fp32 en CPU), 'bf16', 'fp16' o 'fp32'",
+    ),
     vertical: bool = typer.Option(
         True,
         "--vertical/--horizontal",
@@ -66,6 +83,17 @@ def generate(
     no_zoom: bool = typer.Option(
         False, "--no-zoom", help="Desactivar efecto de zoom en el fondo"
     ),
+    workers: int = typer.Option(
+        1,
+        help="Poemas procesados en paralelo. Cada proceso carga su propia copia "
+        "del modelo TTS en memoria/VRAM y solo uno sintetiza a la vez, así que "
+        "más de 2-3 rara vez ayuda",
+    ),
+    skip_existing: bool = typer.Option(
+        False,
+        "--skip-existing",
+        help="Omitir poemas cuyo video ya existe y es más reciente que el .md",
+    ),
     upload: bool = typer.Option(
         False, "--upload", help="Subir videos a Google Drive después de generarlos"
     ),
@@ -76,6 +104,8 @@ def generate(
     ),
 ):
     """Genera audios y videos desde archivos markdown, optimizado para TikTok"""
+    from .generate_videos import main as generate_main
+
     resolution = (1080, 1920) if vertical else (1280, 720)
 
     # Configurar callback de upload si está activado
@@ -88,12 +118,10 @@ def generate(
             )
             raise typer.Exit(1)
 
-        import yaml
         from .drive import authenticate, DriveManager
 
         typer.echo("[poetry-reader] Loading Drive configuration for upload...")
-        with open(drive_config) as f:
-            drive_cfg = yaml.safe_load(f)
+        drive_cfg = _load_drive_config(drive_config, "drive.videos_output_folder_id")
 
         typer.echo("[poetry-reader] Authenticating with Google Drive...")
         drive = authenticate(
@@ -106,6 +134,7 @@ def generate(
             drive,
             max_retries=drive_cfg["processing"]["max_retries"],
             retry_delay=drive_cfg["processing"]["retry_delay_seconds"],
+            max_workers=drive_cfg["processing"].get("max_workers", 8),
         )
 
         videos_folder_id = drive_cfg["drive"]["videos_output_folder_id"]
@@ -124,8 +153,6 @@ def generate(
             typer.echo(f"  → Uploading to Drive: {title}")
 
             # Verificar si ya existe y eliminarlo
-            from pathlib import Path
-
             video_file = Path(video_path)
             existing_file = drive_manager.find_file_by_name(
                 videos_folder_id, video_file.name
@@ -161,10 +188,13 @@ def generate(
         tts_reference_wav=tts_reference_wav,
         device=device,
         tts_model_size=tts_model_size,
+        tts_precision=tts_precision,
         resolution=resolution,
         tiktok_mode=True,
         zoom_background=not no_zoom,
         upload_callback=upload_callback,
+        max_workers=workers,
+        skip_existing=skip_existing,
     )
 
 
@@ -300,9 +330,9 @@ def process_drive(
         poetry-reader process-drive --upload-youtube  # Also upload to YouTube
         poetry-reader process-drive --upload-youtube --youtube-privacy unlisted
     """
-    import yaml
     from .drive import authenticate, DriveManager, ExcelTracker
     from .orchestrator import VideoOrchestrator
+    from .utils import deep_merge, load_yaml
 
     if not drive_config.exists():
         typer.echo(f"Error: Drive config not found: {drive_config}", err=True)
@@ -319,13 +349,12 @@ def process_drive(
         raise typer.Exit(1)
 
     typer.echo("[poetry-reader] Loading configurations...")
-    with open(drive_config) as f:
-        drive_cfg = yaml.safe_load(f)
-
-    with open(video_config) as f:
-        video_cfg = yaml.safe_load(f)
+    drive_cfg = _load_drive_config(
+        drive_config, "drive.excel_tracker_id", "local.cache_dir"
+    )
+    video_cfg = load_yaml(video_config)
 
-    config = {**drive_cfg, **video_cfg}
+    config = deep_merge(drive_cfg, video_cfg)
 
     try:
         typer.echo("[poetry-reader] Authenticating with Google Drive...")
@@ -340,6 +369,7 @@ def process_drive(
             drive,
             max_retries=drive_cfg["processing"]["max_retries"],
             retry_delay=drive_cfg["processing"]["retry_delay_seconds"],
+            max_workers=drive_cfg["processing"].get("max_workers", 8),
         )
 
         excel_tracker_id = drive_cfg["drive"]["excel_tracker_id"]
@@ -389,10 +419,6 @@ def process_drive(
             youtube_privacy=youtube_privacy,
         )
 
-        report = orchestrator.process_all(
-            limit=limit, dry_run=dry_run, upload_to_drive=upload_to_drive
-        )
-
         if report.failed > 0:
             raise typer.Exit(1)
 
@@ -481,15 +507,13 @@ def upload(
         # Determinar el path del video (local o descargar de Drive)
         if is_drive_id:
             # Descargar de Google Drive
-            import yaml
             from .drive import authenticate as drive_auth, DriveManager
 
             if not drive_config.exists():
                 typer.echo(f"Error: Drive config not found: {drive_config}", err=True)
                 raise typer.Exit(1)
 
-            with open(drive_config) as f:
-                drive_cfg = yaml.safe_load(f)
+            drive_cfg = _load_drive_config(drive_config)
 
             typer.echo("[poetry-reader] Authenticating with Google Drive...")
             drive = drive_auth(
@@ -650,7 +674,6 @@ def upload_md(
         # Subir y reemplazar archivos existentes
         poetry-reader upload-md ./poemas --replace
     """
-    import yaml
     from .drive import authenticate, DriveManager
 
     if not drive_config.exists():
@@ -665,8 +688,7 @@ def upload_md(
         raise typer.Exit(1)
 
     typer.echo("[poetry-reader] Loading Drive configuration...")
-    with open(drive_config) as f:
-        drive_cfg = yaml.safe_load(f)
+    drive_cfg = _load_drive_config(drive_config)
 
     # Obtener folder_id del config si no se proporcionó
     if folder_id is None:
@@ -691,6 +713,7 @@ def upload_md(
             drive,
             max_retries=drive_cfg["processing"]["max_retries"],
             retry_delay=drive_cfg["processing"]["retry_delay_seconds"],
+            max_workers=drive_cfg["processing"].get("max_workers", 8),
         )
 
         # Buscar archivos .md
@@ -5,8 +5,13 @@ This package handles authentication, file management, and Excel tracking
 for automated video processing from Google Drive.
 """
 
-from .auth import authenticate
+from .auth import authenticate, clear_auth_cache
 from .manager import DriveManager
 from .tracker import ExcelTracker
 
-__all__ = ["authenticate", "DriveManager", "ExcelTracker"]
+__all__ = [
+    "authenticate",
+    "clear_auth_cache",
+    "DriveManager",
+    "ExcelTracker",
+]
@@ -7,14 +7,57 @@ Handles OAuth2 authentication flow and credential management.
 import os
 import sys
 import json
-import urllib.request
+import time
+import datetime
+import secrets
 import urllib.parse
+import requests
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from pydrive2.auth import GoogleAuth
 from pydrive2.drive import GoogleDrive
 from oauth2client.client import OAuth2Credentials
 
+_SETTINGS_TEMPLATE = """client_config_backend: file
+client_config_file: {client_secrets_path}
+
+save_credentials: True
+save_credentials_backend: file
+save_credentials_file: {credentials_path}
+
+get_refresh_token: True
+
+oauth_scope:
+  - https://www.googleapis.com/auth/drive
+  - https://www.googleapis.com/auth/drive.file
+"""
+
+_AUTH_URI = "https://accounts.google.com/o/oauth2/v2/auth"
+_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+_SCOPES = (
+    "https://www.googleapis.com/auth/drive",
+    "https://www.googleapis.com/auth/drive.file",
+)
+
+# Static part of the authorization URL query; client_id and state vary
+_AUTH_PARAMS_BASE = {
+    "redirect_uri": "urn:ietf:wg:oauth:2.0:oob",
+    "scope": " ".join(_SCOPES),
+    "response_type": "code",
+    "access_type": "offline",
+    "prompt": "consent",
+}
+
+# Marker written next to credentials.json after a successful authentication;
+# while it is fresh, later runs skip the explicit Authorize() step
+_AUTH_MARKER_NAME = ".auth_ok"
+_AUTH_MARKER_TTL = 30 * 60
+
+# Shared HTTP session so token requests reuse the same TLS connection
+_SESSION: Optional[requests.Session] = None
+
 
 class DriveAuthError(Exception):
     """Raised when authentication with Google Drive fails."""
@@ -22,6 +65,7 @@ class DriveAuthError(Exception):
     pass
 
 
+@lru_cache(maxsize=4)
 def authenticate(
     credentials_path: Optional[str] = None,
     client_secrets_path: Optional[str] = None,
@@ -47,6 +91,11 @@ def authenticate(
     Raises:
         DriveAuthError: If authentication fails or client_secrets.json not found
 
+    Note:
+        Results are memoized per process by argument values, so repeated calls
+        return the same GoogleDrive instance. The shared instance is not
+        thread-safe; use clear_auth_cache() to force a fresh authentication.
+
     Example:
         >>> drive = authenticate()
         >>> files = drive.ListFile({'q': "'root' in parents"}).GetList()
@@ -57,17 +106,20 @@ def authenticate(
     if client_secrets_path is None:
         client_secrets_path = "./credentials/client_secrets.json"
 
-    # Convert to absolute paths
-    credentials_path = str(Path(credentials_path).resolve())
-    client_secrets_path = str(Path(client_secrets_path).resolve())
+    # Convert to absolute paths (resolved once, reused below)
+    credentials_file = Path(credentials_path).resolve()
+    client_secrets_file = Path(client_secrets_path).resolve()
+    credentials_path = str(credentials_file)
+    client_secrets_path = str(client_secrets_file)
 
     # Ensure credentials directory exists
-    cred_dir = Path(credentials_path).parent
-    cred_dir.mkdir(parents=True, exist_ok=True)
+    cred_dir = credentials_file.parent
+    if not cred_dir.is_dir():
+        cred_dir.mkdir(parents=True, exist_ok=True)
 
     # Check if client_secrets.json exists
 
-    if not os.path.exists(client_secrets_path):
+    if not client_secrets_file.exists():
         raise DriveAuthError(
             f"client_secrets.json not found at: {client_secrets_path}\n\n"
             "To get started:\n"
@@ -81,12 +133,15 @@ def authenticate(
 
     # Create settings for PyDrive2
     if settings_file is None:
-        # Generate temporary settings
-        settings_file = str((cred_dir / "settings.yaml").resolve())
-        _create_settings_file(settings_file, client_secrets_path, credentials_path)
+        # Generate temporary settings (cred_dir is already absolute)
+        settings_path = cred_dir / "settings.yaml"
+        _create_settings_file(settings_path, client_secrets_file, credentials_file)
+        settings_file = str(settings_path)
     else:
         settings_file = str(Path(settings_file).resolve())
 
+    auth_marker = cred_dir / _AUTH_MARKER_NAME
+
     try:
         # Initialize GoogleAuth
         gauth = GoogleAuth(settings_file=settings_file)
@@ -96,6 +151,9 @@ def authenticate(
 
         # Try to load saved credentials
         gauth.LoadCredentialsFile(credentials_path)
+        loaded_token = (
+            gauth.credentials.access_token if gauth.credentials is not None else None
+        )
 
         if gauth.credentials is None:
             # No credentials found, start OAuth flow
@@ -105,30 +163,15 @@ def authenticate(
             # Get client config
             client_id = gauth.client_config["client_id"]
             client_secret = gauth.client_config["client_secret"]
-            scopes = [
-                "https://www.googleapis.com/auth/drive",
-                "https://www.googleapis.com/auth/drive.file",
-            ]
 
             # Generate authorization URL
-            import secrets
-
-            state = secrets.token_urlsafe(32)
-
             auth_params = {
+                **_AUTH_PARAMS_BASE,
                 "client_id": client_id,
-                "redirect_uri": "urn:ietf:wg:oauth:2.0:oob",
-                "scope": " ".join(scopes),
-                "response_type": "code",
-                "access_type": "offline",
-                "prompt": "consent",
-                "state": state,
+                "state": secrets.token_urlsafe(32),
             }
 
-            auth_url = (
-                "https://accounts.google.com/o/oauth2/v2/auth?"
-                + urllib.parse.urlencode(auth_params)
-            )
+            auth_url = _AUTH_URI + "?" + urllib.parse.urlencode(auth_params)
 
             # Show instructions
             print("=" * 70)
@@ -158,29 +201,21 @@ def authenticate(
             # Exchange code for tokens
             print("[poetry-reader] Exchanging code for tokens...")
 
-            token_data = urllib.parse.urlencode(
-                {
+            response = _get_session().post(
+                _TOKEN_URI,
+                data={
                     "client_id": client_id,
                     "client_secret": client_secret,
                     "code": auth_code,
                     "grant_type": "authorization_code",
                     "redirect_uri": "urn:ietf:wg:oauth:2.0:oob",
-                }
-            ).encode("utf-8")
-
-            token_req = urllib.request.Request(
-                "https://oauth2.googleapis.com/token",
-                data=token_data,
-                headers={"Content-Type": "application/x-www-form-urlencoded"},
-                method="POST",
+                },
+                timeout=30,
             )
-
-            with urllib.request.urlopen(token_req) as response:
-                token_response = json.loads(response.read().decode("utf-8"))
+            response.raise_for_status()
+            token_response = response.json()
 
             # Success! Create OAuth2Credentials object
-            import datetime
-
             token_expiry = datetime.datetime.utcnow() + datetime.timedelta(
                 seconds=token_response["expires_in"]
             )
@@ -191,9 +226,9 @@ def authenticate(
                 client_secret=client_secret,
                 refresh_token=token_response.get("refresh_token"),
                 token_expiry=token_expiry,
-                token_uri="https://oauth2.googleapis.com/token",
+                token_uri=_TOKEN_URI,
                 user_agent="poetry-reader/1.0",
-                scopes=scopes,
+                scopes=list(_SCOPES),
             )
 
             print("[poetry-reader] ✓ Authenticated successfully!")
@@ -201,12 +236,19 @@ def authenticate(
             # Credentials expired, refresh
             print("[poetry-reader] Refreshing expired access token...")
             gauth.Refresh()
+        elif _auth_marker_valid(auth_marker, credentials_file):
+            # Validated recently and nothing changed: pydrive2 authorizes
+            # lazily on the first API call and there is nothing to save
+            print(f"[poetry-reader] ✓ Authenticated successfully")
+            return GoogleDrive(gauth)
         else:
             # Credentials valid, authorize
             gauth.Authorize()
 
-        # Save credentials for next run
-        gauth.SaveCredentialsFile(credentials_path)
+        # Save credentials for next run, unless they are what we just loaded
+        if gauth.credentials.access_token != loaded_token:
+            gauth.SaveCredentialsFile(credentials_path)
+        _write_auth_marker(auth_marker, credentials_file)
         print(f"[poetry-reader] ✓ Authenticated successfully")
 
         # Create and return GoogleDrive instance
@@ -217,38 +259,87 @@ def authenticate(
         raise DriveAuthError(f"Authentication failed: {str(e)}") from e
 
 
-def _create_settings_file(
-    settings_path: str, client_secrets_path: str, credentials_path: str
-) -> None:
+def _get_session() -> requests.Session:
+    """Return the module-wide requests session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+    return _SESSION
+
+
+def clear_auth_cache() -> None:
+    """Drop memoized GoogleDrive instances so the next call re-authenticates."""
+    authenticate.cache_clear()
+
+
+def _auth_marker_valid(marker_path: Path, credentials_path: Path) -> bool:
     """
-    Create a PyDrive2 settings.yaml file with OAuth2 configuration.
+    Check whether a previous authenticate() left a still-valid marker.
+
+    The marker is only trusted while its TTL has not elapsed and the
+    credentials file is the same one that was validated.
 
     Args:
-        settings_path: Where to save settings.yaml
-        client_secrets_path: Path to client_secrets.json
-        credentials_path: Path where credentials will be saved
+        marker_path: Path to the marker file
+        credentials_path: Path to credentials.json
+
+    Returns:
+        bool: True if authorization can be skipped
     """
-    # Ensure absolute paths in settings file
-    settings_path = str(Path(settings_path).resolve())
-    client_secrets_path = str(Path(client_secrets_path).resolve())
-    credentials_path = str(Path(credentials_path).resolve())
+    try:
+        marker = json.loads(marker_path.read_text())
+        return (
+            marker["expiry"] > time.time()
+            and marker["credentials_mtime_ns"] == credentials_path.stat().st_mtime_ns
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
 
-    settings_content = f"""client_config_backend: file
-client_config_file: {client_secrets_path}
 
-save_credentials: True
-save_credentials_backend: file
-save_credentials_file: {credentials_path}
+def _write_auth_marker(marker_path: Path, credentials_path: Path) -> None:
+    """
+    Record a successful authentication for _AUTH_MARKER_TTL seconds.
 
-get_refresh_token: True
+    Written to a temporary file and renamed, so concurrent CLI runs never
+    read a partially written marker.
 
-oauth_scope:
-  - https://www.googleapis.com/auth/drive
-  - https://www.googleapis.com/auth/drive.file
-"""
+    Args:
+        marker_path: Path to the marker file
+        credentials_path: Path to the credentials.json just saved
+    """
+    marker = {
+        "expiry": time.time() + _AUTH_MARKER_TTL,
+        "credentials_mtime_ns": credentials_path.stat().st_mtime_ns,
+    }
+    tmp_path = marker_path.with_name(f"{marker_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(marker))
+    os.replace(tmp_path, marker_path)
+
+
+def _create_settings_file(
+    settings_path: Path, client_secrets_path: Path, credentials_path: Path
+) -> None:
+    """
+    Create a PyDrive2 settings.yaml file with OAuth2 configuration.
+
+    Args:
+        settings_path: Where to save settings.yaml (absolute)
+        client_secrets_path: Absolute path to client_secrets.json
+        credentials_path: Absolute path where credentials will be saved
+    """
+    settings_content = _SETTINGS_TEMPLATE.format(
+        client_secrets_path=client_secrets_path,
+        credentials_path=credentials_path,
+    ).encode("utf-8")
+
+    # Skip the write when nothing changed, so the file's mtime stays stable
+    try:
+        if settings_path.read_bytes() == settings_content:
+            return
+    except FileNotFoundError:
+        pass
 
-    with open(settings_path, "w") as f:
-        f.write(settings_content)
+    settings_path.write_bytes(settings_content)
 
 
 def validate_authentication(drive: GoogleDrive) -> bool:
@@ -262,8 +353,8 @@ def validate_authentication(drive: GoogleDrive) -> bool:
         bool: True if authentication is valid, False otherwise
     """
     try:
-        # Try to list files in root (minimal API call)
-        drive.ListFile({"q": "'root' in parents", "maxResults": 1}).GetList()
+        # about.get is a plain metadata call, cheaper than a files.list search
+        drive.GetAbout()
         return True
     except Exception:
         return False
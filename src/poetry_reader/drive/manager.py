@@ -4,14 +4,47 @@ Google Drive file management module.
 Handles downloading, uploading, and file operations with Google Drive.
 """
 
+import hashlib
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import Callable, Iterator, List, Dict, Optional, Any, Tuple, TypeVar
 from dataclasses import dataclass
+from googleapiclient.http import MediaFileUpload
 from pydrive2.drive import GoogleDrive
 from pydrive2.files import GoogleDriveFile
 
+# HTTP statuses worth retrying: rate limiting and server-side errors
+_TRANSIENT_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Upper bound for a single retry delay, in seconds
+_MAX_RETRY_DELAY = 60.0
+
+T = TypeVar("T")
+
+_VIEW_LINK_TEMPLATE = "https://drive.google.com/file/d/{file_id}/view"
+
+# Files per listing page (the Drive v2 maximum)
+_LIST_PAGE_SIZE = 1000
+
+# Metadata fields FileInfo is built from; requesting only these keeps Drive
+# responses several times smaller than the full file resource
+_FILE_FIELDS = "id,title,mimeType,fileSize,modifiedDate,webViewLink,md5Checksum"
+
+# Drive allows roughly 10 sustained write requests per second per user
+_MAX_WRITES_PER_SECOND = 10.0
+
+# Resumable upload chunk size (must be a multiple of 256 KiB). Larger chunks
+# mean fewer HTTP round-trips; smaller ones lose less progress on failure.
+_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Requests per batch HTTP call; Drive starts returning 500s well below the
+# documented limit of 100, so stay conservative
+_BATCH_SIZE = 50
+
 
 @dataclass
 class FileInfo:
@@ -23,6 +56,92 @@ class FileInfo:
     size: Optional[int] = None
     modifiedDate: Optional[str] = None
     webViewLink: Optional[str] = None
+    md5Checksum: Optional[str] = None
+
+
+def _to_file_info(f: GoogleDriveFile) -> FileInfo:
+    """Build a FileInfo from a PyDrive2 file resource."""
+    return FileInfo(
+        id=f["id"],
+        title=f["title"],
+        mimeType=f.get("mimeType", "unknown"),
+        size=int(f.get("fileSize", 0)) if "fileSize" in f else None,
+        modifiedDate=f.get("modifiedDate"),
+        webViewLink=f.get("webViewLink"),
+        md5Checksum=f.get("md5Checksum"),
+    )
+
+
+def _filter_by_extension(
+    files: List[FileInfo], file_extension: Optional[str]
+) -> List[FileInfo]:
+    """Return a new list with only files whose title ends with `file_extension`."""
+    if not file_extension:
+        return list(files)
+    return [f for f in files if f.title.endswith(file_extension)]
+
+
+class _RateLimiter:
+    """Thread-safe limiter spacing calls at most `rate` per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _local_md5(path: str) -> Optional[str]:
+    """MD5 hex digest of a local file, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "md5").hexdigest()
+    except OSError:
+        return None
+
+
+def _media_upload(local_path: str) -> MediaFileUpload:
+    """Build a chunked, resumable media body for `local_path`."""
+    return MediaFileUpload(local_path, chunksize=_UPLOAD_CHUNK_SIZE, resumable=True)
+
+
+def _http_status(error: BaseException) -> Optional[int]:
+    """Extract the HTTP status from a googleapiclient/pydrive2 error, if any."""
+    # pydrive2's ApiRequestError keeps the underlying HttpError in args[0]
+    # and the parsed error body (with its "code") in .error
+    wrapped = error.args[0] if error.args else None
+    for candidate in (error, wrapped):
+        resp = getattr(candidate, "resp", None)
+        status = getattr(resp, "status", None)
+        if status is not None:
+            try:
+                return int(status)
+            except (TypeError, ValueError):
+                return None
+    body = getattr(error, "error", None)
+    if isinstance(body, dict) and isinstance(body.get("code"), int):
+        return body["code"]
+    return None
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """Whether a failed Drive request is worth retrying."""
+    status = _http_status(error)
+    if status is None:
+        # Network-level failures (timeouts, resets) carry no HTTP status
+        return True
+    if status == 403:
+        # Drive reports rate limiting as 403 with a *RateLimitExceeded reason
+        return "ratelimitexceeded" in str(error).lower()
+    return status in _TRANSIENT_STATUSES
 
 
 class DriveManagerError(Exception):
@@ -40,7 +159,12 @@ class DriveManager:
     """
 
     def __init__(
-        self, drive: GoogleDrive, max_retries: int = 3, retry_delay: float = 5.0
+        self,
+        drive: GoogleDrive,
+        max_retries: int = 3,
+        retry_delay: float = 5.0,
+        max_workers: int = 8,
+        list_cache_ttl: float = 30.0,
     ):
         """
         Initialize DriveManager.
@@ -49,10 +173,21 @@ class DriveManager:
             drive: Authenticated GoogleDrive instance
             max_retries: Maximum number of retry attempts for failed operations
             retry_delay: Delay in seconds between retries
+            max_workers: Maximum number of concurrent transfers for batch operations
+            list_cache_ttl: Seconds a folder listing is reused before re-querying
+                Drive (0 disables the cache)
         """
         self.drive = drive
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_workers = max(1, max_workers)
+        self.list_cache_ttl = list_cache_ttl
+        # (folder_id, mime_type) -> (monotonic timestamp, unfiltered listing)
+        self._list_cache: Dict[
+            Tuple[str, Optional[str]], Tuple[float, List[FileInfo]]
+        ] = {}
+        # Shared by every thread issuing writes through this manager
+        self._write_limiter = _RateLimiter(_MAX_WRITES_PER_SECOND)
 
     def list_files_in_folder(
         self,
@@ -74,43 +209,82 @@ class DriveManager:
         Raises:
             DriveManagerError: If listing fails after retries
         """
+        cache_key = (folder_id, mime_type)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.list_cache_ttl:
+            return _filter_by_extension(cached[1], file_extension)
+
+        files = list(self.iter_files_in_folder(folder_id, mime_type))
+
+        if self.list_cache_ttl > 0:
+            self._list_cache[cache_key] = (time.monotonic(), files)
+
+        return _filter_by_extension(files, file_extension)
+
+    def iter_files_in_folder(
+        self,
+        folder_id: str,
+        mime_type: Optional[str] = None,
+        file_extension: Optional[str] = None,
+    ) -> Iterator[FileInfo]:
+        """
+        Lazily list the files in a Google Drive folder, one page at a time.
+
+        Results from the first page are yielded before later pages are
+        requested, so callers can start working while the listing continues.
+        Each page fetch is retried on its own. Unlike list_files_in_folder,
+        this always queries Drive and does not use the listing cache.
+
+        Args:
+            folder_id: Google Drive folder ID
+            mime_type: Filter by MIME type (e.g., 'text/markdown')
+            file_extension: Filter by file extension (e.g., '.md')
+
+        Yields:
+            FileInfo objects
+
+        Raises:
+            DriveManagerError: If fetching a page fails after retries
+        """
         query = f"'{folder_id}' in parents and trashed=false"
         if mime_type:
             query += f" and mimeType='{mime_type}'"
 
-        for attempt in range(self.max_retries):
-            try:
-                file_list = self.drive.ListFile({"q": query}).GetList()
-
-                files = []
-                for f in file_list:
-                    # Apply extension filter if specified
-                    if file_extension and not f["title"].endswith(file_extension):
-                        continue
-
-                    files.append(
-                        FileInfo(
-                            id=f["id"],
-                            title=f["title"],
-                            mimeType=f.get("mimeType", "unknown"),
-                            size=int(f.get("fileSize", 0)) if "fileSize" in f else None,
-                            modifiedDate=f.get("modifiedDate"),
-                            webViewLink=f.get("webViewLink"),
-                        )
-                    )
-
-                return files
+        pages = iter(
+            self.drive.ListFile(
+                {
+                    "q": query,
+                    "maxResults": _LIST_PAGE_SIZE,
+                    "fields": f"items({_FILE_FIELDS}),nextPageToken",
+                }
+            )
+        )
+        while True:
+            # The page token only advances on success, so a failed fetch
+            # can simply be retried
+            page = self._with_retry(
+                lambda: next(pages, None), "listing files", "Failed to list files"
+            )
+            if page is None:
+                return
+            for f in page:
+                if not file_extension or f["title"].endswith(file_extension):
+                    yield _to_file_info(f)
 
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    print(
-                        f"[poetry-reader] Retry {attempt + 1}/{self.max_retries} after error: {e}"
-                    )
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    raise DriveManagerError(f"Failed to list files: {str(e)}") from e
+    def invalidate_list_cache(self, folder_id: Optional[str] = None) -> None:
+        """
+        Forget cached folder listings.
 
-        return []
+        Args:
+            folder_id: Only drop listings for this folder (default: all folders)
+        """
+        if folder_id is None:
+            self._list_cache.clear()
+            return
+        # Snapshot the keys: concurrent uploads may invalidate at the same time
+        for key in list(self._list_cache):
+            if key[0] == folder_id:
+                self._list_cache.pop(key, None)
 
     def find_file_by_name(self, folder_id: str, filename: str) -> Optional[FileInfo]:
         """
@@ -123,12 +297,17 @@ class DriveManager:
         Returns:
             FileInfo if found, None otherwise
         """
+        # Let Drive match the title server-side instead of listing the folder
+        escaped = filename.replace("\\", "\\\\").replace("'", "\\'")
+        query = f"'{folder_id}' in parents and trashed=false and title='{escaped}'"
         try:
-            files = self.list_files_in_folder(folder_id)
-            for file_info in files:
-                if file_info.title == filename:
-                    return file_info
-            return None
+            # No nextPageToken in the fields, so only the first page is fetched
+            file_list = self.drive.ListFile(
+                {"q": query, "maxResults": 1, "fields": f"items({_FILE_FIELDS})"}
+            ).GetList()
+            if not file_list:
+                return None
+            return _to_file_info(file_list[0])
         except Exception:
             return None
 
@@ -149,25 +328,48 @@ class DriveManager:
         # Ensure parent directory exists
         Path(local_path).parent.mkdir(parents=True, exist_ok=True)
 
-        for attempt in range(self.max_retries):
-            try:
-                file = self.drive.CreateFile({"id": file_id})
-                file.GetContentFile(local_path)
-                print(f"[poetry-reader] ✓ Downloaded: {Path(local_path).name}")
-                return True
+        def _download() -> None:
+            file = self.drive.CreateFile({"id": file_id})
+            file.GetContentFile(local_path)
+
+        self._with_retry(
+            _download,
+            f"downloading {file_id}",
+            f"Failed to download file {file_id}",
+        )
+        print(f"[poetry-reader] ✓ Downloaded: {Path(local_path).name}")
+        return True
+
+    def download_files(self, items: List[Tuple[str, str]]) -> Dict[str, bool]:
+        """
+        Download several files concurrently.
+
+        Each download keeps its own retry logic; PyDrive2 uses a thread-local
+        HTTP connection, so transfers run in parallel up to `max_workers`.
+
+        Args:
+            items: List of (file_id, local_path) pairs
+
+        Returns:
+            Dict mapping file_id to True if downloaded, False if it failed
+        """
 
+        def _download(item: Tuple[str, str]) -> bool:
+            file_id, local_path = item
+            try:
+                return self.download_file(file_id, local_path)
             except Exception as e:
-                if attempt < self.max_retries - 1:
-                    print(
-                        f"[poetry-reader] Retry {attempt + 1}/{self.max_retries} downloading {file_id}"
-                    )
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    raise DriveManagerError(
-                        f"Failed to download file {file_id}: {str(e)}"
-                    ) from e
+                print(f"[poetry-reader] ✗ Failed to download {file_id}: {e}")
+                return False
 
-        return False
+        if not items:
+            return {}
+
+        workers = min(self.max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_download, items))
+
+        return {file_id: ok for (file_id, _), ok in zip(items, results)}
 
     def upload_file(
         self, local_path: str, drive_folder_id: str, filename: Optional[str] = None
@@ -192,30 +394,22 @@ class DriveManager:
         if filename is None:
             filename = Path(local_path).name
 
-        for attempt in range(self.max_retries):
-            try:
-                file = self.drive.CreateFile(
-                    {"title": filename, "parents": [{"id": drive_folder_id}]}
-                )
-                file.SetContentFile(local_path)
-                file.Upload()
-
-                file_id = file["id"]
-                print(f"[poetry-reader] ✓ Uploaded: {filename} (ID: {file_id})")
-                return file_id
-
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    print(
-                        f"[poetry-reader] Retry {attempt + 1}/{self.max_retries} uploading {filename}"
-                    )
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    raise DriveManagerError(
-                        f"Failed to upload {filename}: {str(e)}"
-                    ) from e
+        request = (
+            self._service()
+            .files()
+            .insert(
+                body={"title": filename, "parents": [{"id": drive_folder_id}]},
+                media_body=_media_upload(local_path),
+            )
+        )
+        response = self._run_resumable(
+            request, f"uploading {filename}", f"Failed to upload {filename}"
+        )
+        file_id = response["id"]
+        self.invalidate_list_cache(drive_folder_id)
 
-        raise DriveManagerError(f"Upload failed after {self.max_retries} attempts")
+        print(f"[poetry-reader] ✓ Uploaded: {filename} (ID: {file_id})")
+        return file_id
 
     def update_file(self, file_id: str, local_path: str) -> bool:
         """
@@ -234,35 +428,30 @@ class DriveManager:
         if not os.path.exists(local_path):
             raise DriveManagerError(f"Local file not found: {local_path}")
 
-        for attempt in range(self.max_retries):
-            try:
-                file = self.drive.CreateFile({"id": file_id})
-                file.SetContentFile(local_path)
-                file.Upload()
-                print(
-                    f"[poetry-reader] ✓ Updated file: {file['title']} (ID: {file_id})"
-                )
-                return True
-
-            except Exception as e:
-                if attempt < self.max_retries - 1:
-                    print(
-                        f"[poetry-reader] Retry {attempt + 1}/{self.max_retries} updating {file_id}"
-                    )
-                    time.sleep(self.retry_delay * (attempt + 1))
-                else:
-                    raise DriveManagerError(
-                        f"Failed to update file {file_id}: {str(e)}"
-                    ) from e
-
-        return False
-
-    def get_file_metadata(self, file_id: str) -> Dict[str, Any]:
+        request = (
+            self._service()
+            .files()
+            .update(fileId=file_id, media_body=_media_upload(local_path))
+        )
+        response = self._run_resumable(
+            request, f"updating {file_id}", f"Failed to update file {file_id}"
+        )
+        title = response.get("title", file_id)
+        # Cached size/modifiedDate for this file are now stale
+        self.invalidate_list_cache()
+
+        print(f"[poetry-reader] ✓ Updated file: {title} (ID: {file_id})")
+        return True
+
+    def get_file_metadata(
+        self, file_id: str, fields: Optional[str] = _FILE_FIELDS
+    ) -> Dict[str, Any]:
         """
         Get metadata for a file in Google Drive.
 
         Args:
             file_id: Google Drive file ID
+            fields: Comma-separated metadata fields to fetch (None for all)
 
         Returns:
             Dict with file metadata
@@ -272,7 +461,7 @@ class DriveManager:
         """
         try:
             file = self.drive.CreateFile({"id": file_id})
-            file.FetchMetadata()
+            file.FetchMetadata(fields=fields)
             return dict(file)
         except Exception as e:
             raise DriveManagerError(
@@ -290,8 +479,7 @@ class DriveManager:
         Returns:
             bool: True if file exists locally
         """
-        local_path = Path(local_dir) / filename
-        return local_path.exists()
+        return os.path.exists(os.path.join(local_dir, filename))
 
     def get_shareable_link(self, file_id: str) -> str:
         """
@@ -308,14 +496,14 @@ class DriveManager:
         """
         try:
             file = self.drive.CreateFile({"id": file_id})
-            file.FetchMetadata()
 
             # Make file shareable (anyone with link can view)
-            permission = file.InsertPermission(
+            file.InsertPermission(
                 {"type": "anyone", "value": "anyone", "role": "reader"}
             )
 
-            return file.get("webViewLink", f"https://drive.google.com/file/d/{file_id}")
+            # The view link is derived from the ID, so no metadata fetch needed
+            return _VIEW_LINK_TEMPLATE.format(file_id=file_id)
 
         except Exception as e:
             raise DriveManagerError(
@@ -336,13 +524,191 @@ class DriveManager:
             DriveManagerError: If deletion fails
         """
         try:
+            self._write_limiter.acquire()
             file = self.drive.CreateFile({"id": file_id})
             file.Trash()
+            # The parent folder is unknown here, so drop every cached listing
+            self.invalidate_list_cache()
             print(f"[poetry-reader] ✓ Deleted file: {file_id}")
             return True
         except Exception as e:
             raise DriveManagerError(f"Failed to delete file {file_id}: {str(e)}") from e
 
+    def batch_insert_permission(self, file_ids: List[str]) -> Dict[str, bool]:
+        """
+        Make several files readable by anyone with the link, in batches.
+
+        Args:
+            file_ids: Google Drive file IDs
+
+        Returns:
+            Dict mapping file_id to True if the permission was added
+        """
+        service = self._service()
+        body = {"type": "anyone", "value": "anyone", "role": "reader"}
+        results = self._run_batch(
+            file_ids,
+            lambda file_id: service.permissions().insert(fileId=file_id, body=body),
+        )
+        return {file_id: result is not None for file_id, result in results.items()}
+
+    def batch_get_shareable_links(self, file_ids: List[str]) -> Dict[str, str]:
+        """
+        Get shareable links for several files, sharing them in batches.
+
+        Args:
+            file_ids: Google Drive file IDs
+
+        Returns:
+            Dict mapping file_id to its view link, for files that were shared
+        """
+        shared = self.batch_insert_permission(file_ids)
+        return {
+            file_id: _VIEW_LINK_TEMPLATE.format(file_id=file_id)
+            for file_id, ok in shared.items()
+            if ok
+        }
+
+    def _with_retry(
+        self, operation: Callable[[], T], description: str, error_message: str
+    ) -> T:
+        """
+        Run a Drive operation, retrying transient failures with backoff.
+
+        Delays grow exponentially from `retry_delay` (capped at
+        _MAX_RETRY_DELAY) plus random jitter, so concurrent workers hitting a
+        rate limit do not retry in lockstep. Permanent errors such as 404 or
+        401 are raised immediately instead of being retried.
+
+        Args:
+            operation: Zero-argument callable performing the request
+            description: What is being done, for retry log lines
+            error_message: Prefix for the DriveManagerError raised on failure
+
+        Returns:
+            Whatever `operation` returns
+
+        Raises:
+            DriveManagerError: If the operation fails permanently or after retries
+        """
+        for attempt in range(self.max_retries):
+            try:
+                return operation()
+            except Exception as e:
+                if attempt < self.max_retries - 1 and _is_transient_error(e):
+                    print(
+                        f"[poetry-reader] Retry {attempt + 1}/{self.max_retries} "
+                        f"{description} after error: {e}"
+                    )
+                    delay = min(_MAX_RETRY_DELAY, self.retry_delay * 2**attempt)
+                    time.sleep(delay + random.uniform(0, self.retry_delay))
+                else:
+                    raise DriveManagerError(f"{error_message}: {str(e)}") from e
+
+        raise DriveManagerError(f"{error_message}: no attempts made")
+
+    def _run_resumable(
+        self, request: Any, description: str, error_message: str
+    ) -> Dict[str, Any]:
+        """
+        Drive a resumable upload request to completion, chunk by chunk.
+
+        The same request object is reused across retries, so a failure late
+        in a large upload resumes from the last acknowledged chunk instead of
+        starting over. Every attempt goes through the shared write limiter,
+        so new and overwriting uploads both respect Drive's write quota.
+
+        Args:
+            request: Drive API request built with a resumable media body
+            description: What is being done, for retry log lines
+            error_message: Prefix for the DriveManagerError raised on failure
+
+        Returns:
+            The file resource returned by Drive once the upload completes
+
+        Raises:
+            DriveManagerError: If the upload fails permanently or after retries
+        """
+
+        def _upload_chunks() -> Dict[str, Any]:
+            self._write_limiter.acquire()
+            response = None
+            while response is None:
+                _, response = request.next_chunk(http=self._thread_http())
+            return response
+
+        return self._with_retry(_upload_chunks, description, error_message)
+
+    def _service(self) -> Any:
+        """Return the underlying Drive API service, authorizing if needed."""
+        if self.drive.auth.service is None:
+            self.drive.auth.Authorize()
+        return self.drive.auth.service
+
+    def _thread_http(self) -> Any:
+        """
+        Return an authorized HTTP object owned by the calling thread.
+
+        httplib2.Http is not thread-safe and `auth.http` is shared by every
+        thread, so requests built here are executed with a per-thread object,
+        cached on `auth.thread_local` the same way PyDrive2's own calls do.
+        """
+        auth = self.drive.auth
+        if auth.service is None:
+            auth.Authorize()
+        http = getattr(auth.thread_local, "http", None)
+        if http is None:
+            http = auth.thread_local.http = auth.Get_Http_Object()
+        return http
+
+    def _run_batch(
+        self, file_ids: List[str], make_request: Any
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Execute one API request per file ID, packed into batch HTTP calls.
+
+        Media transfers cannot be batched, so this is only meant for
+        metadata, permission and trash requests.
+
+        Args:
+            file_ids: Google Drive file IDs
+            make_request: Callable building the API request for one file ID
+
+        Returns:
+            Dict mapping file_id to the response, or None if it failed
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        unique_ids = list(dict.fromkeys(file_ids))
+
+        def _callback(request_id: str, response: Any, exception: Any) -> None:
+            if exception is not None:
+                print(
+                    f"[poetry-reader] ✗ Batch request failed for {request_id}: {exception}"
+                )
+                results[request_id] = None
+            else:
+                results[request_id] = response if response is not None else {}
+
+        service = self._service()
+        for start in range(0, len(unique_ids), _BATCH_SIZE):
+            chunk = unique_ids[start : start + _BATCH_SIZE]
+            batch = service.new_batch_http_request(callback=_callback)
+            for file_id in chunk:
+                batch.add(make_request(file_id), request_id=file_id)
+
+            try:
+                self._with_retry(
+                    lambda: batch.execute(http=self._thread_http()),
+                    "executing batch",
+                    "Batch request failed",
+                )
+            except DriveManagerError as e:
+                print(f"[poetry-reader] ✗ {e}")
+                for file_id in chunk:
+                    results.setdefault(file_id, None)
+
+        return results
+
     def download_markdowns_from_folder(
         self, folder_id: str, local_dir: str, filenames: Optional[List[str]] = None
     ) -> Dict[str, str]:
@@ -370,22 +736,47 @@ class DriveManager:
             print(f"[poetry-reader] No markdown files found in folder {folder_id}")
             return {}
 
-        downloaded = {}
+        wanted = set(filenames) if filenames else None
+        # Keyed by filename so duplicate titles never write the same path concurrently
+        to_download: Dict[str, FileInfo] = {}
 
         for file_info in md_files:
             filename = file_info.title
 
             # Skip if specific filenames requested and this isn't one of them
-            if filenames and filename not in filenames:
+            if wanted is not None and filename not in wanted:
                 continue
 
-            local_path = str(Path(local_dir) / filename)
+            to_download[filename] = file_info
+
+        local_paths = {
+            filename: str(Path(local_dir) / filename) for filename in to_download
+        }
+
+        # Local copies whose content matches Drive's checksum need no transfer
+        up_to_date = {
+            name
+            for name, info in to_download.items()
+            if info.md5Checksum and _local_md5(local_paths[name]) == info.md5Checksum
+        }
+        if up_to_date:
+            print(
+                f"[poetry-reader] {len(up_to_date)} markdown files already up to date"
+            )
 
-            try:
-                self.download_file(file_info.id, local_path)
-                downloaded[filename] = local_path
-            except Exception as e:
-                print(f"[poetry-reader] ✗ Failed to download {filename}: {e}")
+        results = self.download_files(
+            [
+                (info.id, local_paths[name])
+                for name, info in to_download.items()
+                if name not in up_to_date
+            ]
+        )
+
+        downloaded = {
+            name: local_paths[name]
+            for name, info in to_download.items()
+            if name in up_to_date or results.get(info.id)
+        }
 
         print(f"[poetry-reader] ✓ Downloaded {len(downloaded)} markdown files")
         return downloaded
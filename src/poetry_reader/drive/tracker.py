@@ -5,10 +5,26 @@ Handles loading, updating, and saving the Excel file that tracks
 which markdowns have been processed into videos.
 """
 
+import hashlib
+import importlib.util
+import os
 import pandas as pd
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+
+# Rust-backed calamine parses xlsx several times faster than openpyxl; it is
+# optional, so fall back to openpyxl when python-calamine is not installed
+_READ_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+
+# Bump when the sidecar layout changes so old snapshots are ignored
+_SNAPSHOT_VERSION = 2
+
+
+def _file_md5(path: str) -> str:
+    """MD5 hex digest of a file's bytes."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "md5").hexdigest()
 
 
 class TrackerError(Exception):
@@ -31,17 +47,27 @@ class ExcelTracker:
 
     REQUIRED_COLUMNS = ["Archivo", "Hecho"]
     OPTIONAL_COLUMNS = ["video_drive_id", "video_url", "fecha_procesado", "error"]
+    TRUTHY_VALUES = ("sí", "si", "yes", "true", "1", "hecho")
 
-    def __init__(self, excel_path: str):
+    def __init__(self, excel_path: str, track_changes: bool = False):
         """
         Initialize ExcelTracker.
 
         Args:
             excel_path: Path to Excel file (.xlsx)
+            track_changes: Keep a copy of the data as loaded in `_original_df`
+                (doubles memory, so it is off by default)
         """
         self.excel_path = excel_path
+        self.track_changes = track_changes
         self.df: Optional[pd.DataFrame] = None
         self._original_df: Optional[pd.DataFrame] = None
+        # Filename -> index label of its first row, kept in sync with self.df
+        self._name_to_idx: Dict[str, Any] = {}
+        # Whether self.df has changes not yet written to excel_path
+        self._dirty = False
+        # Row counts by status, updated incrementally by the mark_* methods
+        self._counts: Dict[str, int] = {"processed": 0, "pending": 0, "failed": 0}
 
     def load(self) -> pd.DataFrame:
         """
@@ -57,8 +83,11 @@ class ExcelTracker:
             raise TrackerError(f"Excel file not found: {self.excel_path}")
 
         try:
-            self.df = pd.read_excel(self.excel_path)
-            self._original_df = self.df.copy()
+            self.df = self._read_snapshot()
+            if self.df is None:
+                self.df = pd.read_excel(self.excel_path, engine=_READ_ENGINE)
+            if self.track_changes:
+                self._original_df = self.df.copy()
 
             # Validate structure
             if not self.validate_structure():
@@ -86,6 +115,10 @@ class ExcelTracker:
             # Normalize 'Hecho' column to boolean
             self._normalize_hecho_column()
 
+            self._rebuild_name_index()
+            self._recount()
+            self._dirty = False
+
             print(
                 f"[poetry-reader] ✓ Excel loaded: {len(self.df)} rows, "
                 f"{self._count_pending()} pending"
@@ -96,6 +129,40 @@ class ExcelTracker:
         except Exception as e:
             raise TrackerError(f"Failed to load Excel: {str(e)}") from e
 
+    def _rebuild_name_index(self) -> None:
+        """Rebuild the filename -> index lookup from the current DataFrame."""
+        self._name_to_idx = {}
+        if self.df is None:
+            return
+        for idx, name in zip(self.df.index, self.df["Archivo"].to_numpy()):
+            # Keep the first row for duplicated filenames
+            self._name_to_idx.setdefault(name, idx)
+
+    def _recount(self) -> None:
+        """Recompute the cached status counters with one pass over the data."""
+        self._counts = {"processed": 0, "pending": 0, "failed": 0}
+        if self.df is None:
+            return
+        processed = int(self.df["Hecho"].to_numpy(dtype=bool).sum())
+        self._counts["processed"] = processed
+        self._counts["pending"] = len(self.df) - processed
+        self._counts["failed"] = int(self.df["error"].notna().sum())
+
+    def _row_state(self, index: Any) -> Tuple[bool, bool]:
+        """Return (hecho, has_error) for a row, as tracked by the counters."""
+        return bool(self.df.at[index, "Hecho"]), pd.notna(self.df.at[index, "error"])
+
+    def _update_counts(
+        self, before: Tuple[bool, bool], after: Tuple[bool, bool]
+    ) -> None:
+        """Adjust cached counters for one row changing from `before` to `after`."""
+        if before[0] != after[0]:
+            delta = 1 if after[0] else -1
+            self._counts["processed"] += delta
+            self._counts["pending"] -= delta
+        if before[1] != after[1]:
+            self._counts["failed"] += 1 if after[1] else -1
+
     def validate_structure(self) -> bool:
         """
         Validate that Excel has required columns.
@@ -121,19 +188,22 @@ class ExcelTracker:
         if self.df is None:
             return
 
-        def to_bool(value):
-            if pd.isna(value):
-                return False
-            if isinstance(value, bool):
-                return value
-            if isinstance(value, (int, float)):
-                return bool(value)
-            if isinstance(value, str):
-                value_lower = value.strip().lower()
-                return value_lower in ("sí", "si", "yes", "true", "1", "hecho")
-            return False
+        hecho = self.df["Hecho"]
+        if pd.api.types.is_bool_dtype(hecho):
+            # Nullable "boolean" columns may hold NA
+            self.df["Hecho"] = hecho.fillna(False).astype(bool)
+            return
+        if pd.api.types.is_numeric_dtype(hecho):
+            self.df["Hecho"] = hecho.fillna(0).astype(bool)
+            return
 
-        self.df["Hecho"] = self.df["Hecho"].apply(to_bool)
+        # Mixed/text column: strings must match TRUTHY_VALUES ("2" or "0.5"
+        # are not done), while real numbers and bools count when non-zero
+        is_text = hecho.map(type).eq(str)
+        text = hecho.astype("string").str.strip().str.lower()
+        is_truthy = text.isin(self.TRUTHY_VALUES).fillna(False).astype(bool)
+        numeric = pd.to_numeric(hecho.where(~is_text), errors="coerce")
+        self.df["Hecho"] = (is_truthy & is_text) | numeric.fillna(0).ne(0)
 
     def get_pending_files(self) -> List[Dict[str, Any]]:
         """
@@ -151,18 +221,15 @@ class ExcelTracker:
         if self.df is None:
             raise TrackerError("Excel not loaded. Call load() first.")
 
-        pending_df = self.df[self.df["Hecho"] == False].copy()
+        # Plain array masking avoids boxing every row into a Series
+        pending = ~self.df["Hecho"].to_numpy(dtype=bool)
+        indices = self.df.index[pending]
+        filenames = self.df["Archivo"].to_numpy()[pending]
 
-        result = []
-        for idx, row in pending_df.iterrows():
-            result.append(
-                {
-                    "index": idx,
-                    "filename": row["Archivo"],
-                }
-            )
-
-        return result
+        return [
+            {"index": idx, "filename": filename}
+            for idx, filename in zip(indices, filenames)
+        ]
 
     def get_processed_filenames(self) -> set:
         """
@@ -187,11 +254,29 @@ class ExcelTracker:
         Returns:
             Index of the newly added row
         """
+        return self.add_new_files([filename])[0]
+
+    def add_new_files(self, filenames: List[str]) -> List[int]:
+        """
+        Add several new files to the tracker with a single concat.
+
+        Appending row by row reallocates the whole DataFrame each time, so
+        callers discovering many files should add them in one batch.
+
+        Args:
+            filenames: Names of the markdown files
+
+        Returns:
+            Indices of the newly added rows, in the same order
+        """
         if self.df is None:
             raise TrackerError("Excel not loaded. Call load() first.")
 
-        # Create new row DataFrame to preserve dtypes
-        new_row_df = pd.DataFrame(
+        if not filenames:
+            return []
+
+        # Create new rows DataFrame to preserve dtypes
+        new_rows_df = pd.DataFrame(
             [
                 {
                     "Archivo": filename,
@@ -200,18 +285,25 @@ class ExcelTracker:
                     "fecha_procesado": None,
                     "error": None,
                 }
+                for filename in filenames
             ]
         )
 
         # Concatenate preserving dtypes
-        self.df = pd.concat([self.df, new_row_df], ignore_index=True)
+        start = len(self.df)
+        self.df = pd.concat([self.df, new_rows_df], ignore_index=True)
 
         # Ensure video_drive_id remains object dtype
         self.df["video_drive_id"] = self.df["video_drive_id"].astype("object")
 
-        new_idx = len(self.df) - 1
-        print(f"[poetry-reader] ✓ Added new file to tracker: {filename}")
-        return new_idx
+        new_indices = list(range(start, len(self.df)))
+        for filename, new_idx in zip(filenames, new_indices):
+            self._name_to_idx.setdefault(filename, new_idx)
+            print(f"[poetry-reader] ✓ Added new file to tracker: {filename}")
+
+        self._counts["pending"] += len(new_indices)
+        self._dirty = True
+        return new_indices
 
     def mark_processed(
         self, index: int, video_id: str, video_url: Optional[str] = None
@@ -230,12 +322,15 @@ class ExcelTracker:
         if index not in self.df.index:
             raise TrackerError(f"Invalid index: {index}")
 
+        before = self._row_state(index)
         self.df.at[index, "Hecho"] = True
         self.df.at[index, "video_drive_id"] = video_id
         self.df.at[index, "fecha_procesado"] = datetime.now().strftime(
             "%Y-%m-%d %H:%M:%S"
         )
         self.df.at[index, "error"] = None  # Clear any previous errors
+        self._update_counts(before, self._row_state(index))
+        self._dirty = True
 
         print(f"[poetry-reader] ✓ Marked as processed: {self.df.at[index, 'Archivo']}")
 
@@ -253,22 +348,32 @@ class ExcelTracker:
         if index not in self.df.index:
             raise TrackerError(f"Invalid index: {index}")
 
+        before = self._row_state(index)
         self.df.at[index, "Hecho"] = False
         self.df.at[index, "error"] = error_message
         self.df.at[index, "fecha_procesado"] = datetime.now().strftime(
             "%Y-%m-%d %H:%M:%S"
         )
+        self._update_counts(before, self._row_state(index))
+        self._dirty = True
 
         print(
             f"[poetry-reader] ✗ Marked as failed: {self.df.at[index, 'Archivo']} - {error_message}"
         )
 
-    def save(self, output_path: Optional[str] = None) -> None:
+    def save(self, output_path: Optional[str] = None, force: bool = False) -> bool:
         """
         Save DataFrame back to Excel.
 
+        Saving to the original path is skipped when nothing changed since the
+        last load or save, since every write re-serializes the whole workbook.
+
         Args:
             output_path: Optional different path to save to (default: original path)
+            force: Write even if there are no unsaved changes
+
+        Returns:
+            bool: True if the file was written, False if it was already up to date
 
         Raises:
             TrackerError: If save fails
@@ -277,6 +382,8 @@ class ExcelTracker:
             raise TrackerError("No data to save. Load Excel first.")
 
         save_path = output_path or self.excel_path
+        if not (self._dirty or force or save_path != self.excel_path):
+            return False
 
         try:
             # Ensure parent directory exists
@@ -285,15 +392,65 @@ class ExcelTracker:
             # Save to Excel
             self.df.to_excel(save_path, index=False, engine="openpyxl")
             print(f"[poetry-reader] ✓ Excel saved: {save_path}")
+            if save_path == self.excel_path:
+                self._dirty = False
+                self._write_snapshot()
+            return True
 
         except Exception as e:
             raise TrackerError(f"Failed to save Excel: {str(e)}") from e
 
+    @property
+    def snapshot_path(self) -> Path:
+        """Pickle sidecar mirroring the last saved Excel file."""
+        return Path(self.excel_path).with_suffix(".snapshot.pkl")
+
+    def _read_snapshot(self) -> Optional[pd.DataFrame]:
+        """
+        Load the tracker from the sidecar if it mirrors the Excel file.
+
+        The Excel file stays the source of truth (it is what gets shared on
+        Drive); the sidecar is only used when the Excel bytes are exactly the
+        ones it was written alongside, which skips parsing the xlsx. It is a
+        pickle so column dtypes (e.g. datetimes) survive the round trip and
+        the next save writes back exactly what was loaded.
+
+        Returns:
+            DataFrame from the sidecar, or None if it is missing or stale
+        """
+        if not self.snapshot_path.exists():
+            return None
+        try:
+            snapshot = pd.read_pickle(self.snapshot_path)
+            if snapshot.get("version") != _SNAPSHOT_VERSION or snapshot.get(
+                "excel_md5"
+            ) != _file_md5(self.excel_path):
+                return None
+            return snapshot["df"]
+        except Exception:
+            # Unreadable or foreign sidecar: fall back to parsing the xlsx
+            return None
+
+    def _write_snapshot(self) -> None:
+        """Mirror the just-saved DataFrame into the sidecar."""
+        tmp_path = self.snapshot_path.with_name(f"{self.snapshot_path.name}.tmp")
+        try:
+            snapshot = {
+                "version": _SNAPSHOT_VERSION,
+                "excel_md5": _file_md5(self.excel_path),
+                "df": self.df,
+            }
+            pd.to_pickle(snapshot, tmp_path)
+            os.replace(tmp_path, self.snapshot_path)
+        except Exception as e:
+            # The snapshot is only a load-time shortcut; never fail a save on it
+            print(f"[poetry-reader] ⚠ Could not update tracker snapshot: {e}")
+
     def _count_pending(self) -> int:
         """Count number of pending markdowns."""
         if self.df is None:
             return 0
-        return len(self.df[self.df["Hecho"] == False])
+        return self._counts["pending"]
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -305,17 +462,7 @@ class ExcelTracker:
         if self.df is None:
             return {"total": 0, "processed": 0, "pending": 0, "failed": 0}
 
-        total = len(self.df)
-        processed = len(self.df[self.df["Hecho"] == True])
-        pending = len(self.df[self.df["Hecho"] == False])
-        failed = len(self.df[~self.df["error"].isna()])
-
-        return {
-            "total": total,
-            "processed": processed,
-            "pending": pending,
-            "failed": failed,
-        }
+        return {"total": len(self.df), **self._counts}
 
     def reset_row(self, index: int) -> None:
         """
@@ -330,11 +477,14 @@ class ExcelTracker:
         if index not in self.df.index:
             raise TrackerError(f"Invalid index: {index}")
 
+        before = self._row_state(index)
         self.df.at[index, "Hecho"] = False
         self.df.at[index, "video_drive_id"] = None
         self.df.at[index, "video_url"] = None
         self.df.at[index, "fecha_procesado"] = None
         self.df.at[index, "error"] = None
+        self._update_counts(before, self._row_state(index))
+        self._dirty = True
 
         print(f"[poetry-reader] ✓ Reset row: {self.df.at[index, 'Archivo']}")
 
@@ -351,12 +501,11 @@ class ExcelTracker:
         if self.df is None:
             return None
 
-        matches = self.df[self.df["Archivo"] == filename]
-        if len(matches) == 0:
+        idx = self._name_to_idx.get(filename)
+        if idx is None:
             return None
 
-        row = matches.iloc[0]
-        return row.to_dict()
+        return self.df.loc[idx].to_dict()
 
     def get_index_by_filename(self, filename: str) -> Optional[Any]:
         """
@@ -371,8 +520,4 @@ class ExcelTracker:
         if self.df is None:
             return None
 
-        matches = self.df[self.df["Archivo"] == filename]
-        if len(matches) == 0:
-            return None
-
-        return matches.index[0]
+        return self._name_to_idx.get(filename)
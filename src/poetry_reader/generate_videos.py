@@ -1,63 +1,131 @@
 import os
 import logging
+import multiprocessing
 import re
-import wave
-from glob import glob
-from typing import Optional, Callable
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Callable
 import unicodedata
 
-from moviepy.audio.io.AudioFileClip import AudioFileClip
-from moviepy.audio.AudioClip import concatenate_audioclips
-from langdetect import detect
+import numpy as np
+import soundfile as sf
 
-from .ttsgenerator import get_tts
+from . import tts_cache
+from .ttsgenerator import (
+    Qwen3TTSWrapper,
+    get_tts,
+    resolve_device,
+    resolve_model_name,
+)
 from .video_generator import create_video_with_subtitles
 from .utils import parse_md_file
 
 LOGGER = logging.getLogger(__name__)
 
+try:
+    from langdetect import DetectorFactory, detect
+
+    # langdetect is randomized; a fixed seed makes results stable and cacheable
+    DetectorFactory.seed = 0
+except ImportError:
+    # Fall back to the accent heuristic in detect_language()
+    detect = None
+
+_SPANISH_CHARS = frozenset("áéíóúñÁÉÍÓÚÑ¿¡")
+# Share of letters that must be Spanish-only characters to skip langdetect;
+# real Spanish prose sits around 2-4%, while an English text with a loanword
+# such as "café" stays well below
+_SPANISH_CHAR_RATIO = 0.02
+# Spanish-only characters needed before the ratio is trusted, so a single
+# loanword in a short text ("piñata") still goes to langdetect
+_SPANISH_CHAR_MIN = 3
+# langdetect only looks at this many leading characters; a poem's language
+# does not change halfway through, and the cost grows with the text length
+_DETECT_PREFIX_CHARS = 512
+# Below this length langdetect is unreliable; the accent heuristic decides
+_DETECT_MIN_CHARS = 40
+
+_SENTENCE_RE = re.compile(r"(?<=[\.\?!])\s+")
+
+
+class _TranslateTable(dict):
+    """`str.translate` table that keeps the characters accepted by `keep`.
+
+    Filled lazily per codepoint, so it covers all of Unicode while each
+    character is only classified once.
+    """
+
+    def __init__(self, keep: Callable[[str], bool]):
+        super().__init__()
+        self._keep = keep
+
+    def __missing__(self, cp: int):
+        ch = chr(cp)
+        value = ch if self._keep(ch) else None
+        self[cp] = value
+        return value
+
+
+_FILENAME_TABLE = _TranslateTable(lambda ch: ch.isalnum() or ch in " -_")
+# Strips combining marks except the tilde, which is kept for ñ/Ñ below
+_STRIP_ACCENTS_TABLE = _TranslateTable(
+    lambda ch: not unicodedata.combining(ch) or ch == "\u0303"
+)
+# A combining tilde that does not belong to an n/N (e.g. from "ã")
+_STRAY_TILDE_RE = re.compile("(?<![nN])\u0303")
+
 
 def detect_language(text: str) -> str:
-    """Detect language code for `text`. Prefers `langdetect` if available,
-    otherwise uses a simple heuristic checking for accented characters.
+    """Detect language code for `text`. Text dense in Spanish accents is
+    classified directly; otherwise prefers `langdetect` if available and the
+    text is long enough for it, falling back to a simple heuristic checking
+    for accented characters.
     Returns a 2-letter code like 'es' or 'en'.
     """
     if not text or not text.strip():
         return "en"
-    if detect:
+    # Accents, ñ and inverted marks settle the common case without langdetect
+    spanish = sum(text.count(c) for c in _SPANISH_CHARS)
+    if spanish >= _SPANISH_CHAR_MIN:
+        letters = sum(ch.isalpha() for ch in text)
+        if letters >= _DETECT_MIN_CHARS and spanish >= _SPANISH_CHAR_RATIO * letters:
+            return "es"
+    if detect and len(text.strip()) >= _DETECT_MIN_CHARS:
         try:
-            code = detect(text)
-            return code.split("-")[0]
+            return _detect_cached(text[:_DETECT_PREFIX_CHARS].strip())
         except Exception:
             pass
-    spanish_chars = set("áéíóúñÁÉÍÓÚÑ¿¡")
-    if any(c in spanish_chars for c in text):
+    if spanish:
         return "es"
     return "en"
 
 
+@lru_cache(maxsize=1024)
+def _detect_cached(text: str) -> str:
+    return detect(text).split("-")[0]
+
+
 def normalize_text_for_tts(text: str) -> str:
     """Remove accent marks from text for TTS models with limited vocabularies.
 
     Converts: á->a, é->e, í->i, ó->o, ú->u, ñ->ñ (keep ñ)
     This helps with TTS models that don't support accented characters.
     """
-    nfd = unicodedata.normalize("NFD", text)
-    result = []
-    for char in nfd:
-        if char in "ñÑ":
-            result.append(char)
-        elif not unicodedata.combining(char):
-            result.append(char)
-    return "".join(result)
+    # ñ decomposes to n + combining tilde: keep that tilde, drop every other
+    # mark, then recompose
+    text = unicodedata.normalize("NFD", text).translate(_STRIP_ACCENTS_TABLE)
+    return unicodedata.normalize("NFC", _STRAY_TILDE_RE.sub("", text))
 
 
 def sanitize_filename(s: str) -> str:
-    return "".join(c for c in s if c.isalnum() or c in (" ", "-", "_")).rstrip()
+    return s.translate(_FILENAME_TABLE).rstrip()
 
 
 def split_text_into_sentences(text: str):
-    parts = re.split(r"(?<=[\.\?!])\s+", text.strip())
+    parts = _SENTENCE_RE.split(text.strip())
     return [p.strip() for p in parts if p.strip()]
 
 
@@ -68,18 +136,302 @@ def split_text_into_lines(text: str):
     """
     if text is None:
         return []
-    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
-    return lines
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.split("\n")
+
+
+@lru_cache(maxsize=8)
+def silence(duration: float, sr: int) -> np.ndarray:
+    """Return a shared, read-only mono float32 silence of `duration` seconds."""
+    block = np.zeros(int(duration * sr), dtype=np.float32)
+    block.flags.writeable = False
+    return block
+
+
+@dataclass
+class VideoJobConfig:
+    """Per-poem settings shared by every job of a `main()` run.
+
+    Kept picklable so jobs can be shipped to worker processes.
+    """
+
+    out_dir: str = "output"
+    image_path: Optional[str] = None
+    gradient_palette: Optional[str] = None
+    add_particles: bool = True
+    font_size: int = 80
+    fade_duration: float = 0.5
+    force_lang: Optional[str] = None
+    fps: int = 30
+    num_particles: int = 80
+    tts_backend: str = "qwen3"
+    tts_model: Optional[str] = None
+    tts_reference_wav: Optional[str] = None
+    device: str = "auto"
+    tts_model_size: str = "1.7B"
+    tts_precision: str = "auto"
+    resolution: tuple = (1080, 1920)
+    tiktok_mode: bool = True
+    zoom_background: bool = True
+    skip_existing: bool = False
+
+
+# TTS models loaded by this process, keyed by their settings; module-level so
+# repeated main() calls in one process (e.g. the orchestrator) reuse them
+_TTS_INSTANCES: Dict[str, Any] = {}
+_WARMED_UP = set()
+
+# Poems whose audio is ready but whose video is still queued for encoding
+_MAX_PENDING_RENDERS = 2
+
+# Set in pool workers so only one of them runs TTS at a time
+_TTS_LOCK = None
+
+
+def _init_worker(tts_lock, cfg: VideoJobConfig, lang: Optional[str]) -> None:
+    global _TTS_LOCK
+    _TTS_LOCK = tts_lock
+    if lang:
+        with tts_lock:
+            warm_up(cfg, lang)
+
+
+def _get_tts_instance(cfg: VideoJobConfig, lang: str):
+    # Key on what is actually loaded, so equivalent settings ('auto' vs the
+    # device it resolves to, languages the backend maps to the same voice
+    # language, model_size vs an explicit model name) share one model
+    voice_lang = Qwen3TTSWrapper.LANG_MAP.get(lang.lower(), "Spanish")
+    model = resolve_model_name(cfg.tts_model, cfg.tts_model_size)
+    reference = os.path.abspath(cfg.tts_reference_wav) if cfg.tts_reference_wav else ""
+    tts_key = f"{cfg.tts_backend}:{voice_lang}:{model}:{reference}:{resolve_device(cfg.device)}:{cfg.tts_precision}"
+    if tts_key not in _TTS_INSTANCES:
+        _TTS_INSTANCES[tts_key] = get_tts(
+            backend=cfg.tts_backend,
+            lang=lang,
+            model_name=cfg.tts_model,
+            reference_wav_path=cfg.tts_reference_wav,
+            device=cfg.device,
+            model_size=cfg.tts_model_size,
+            precision=cfg.tts_precision,
+        )
+    LOGGER.debug("TTS instance: %s", tts_key)
+    return _TTS_INSTANCES[tts_key]
+
+
+def warm_up(cfg: VideoJobConfig, lang: str):
+    """Load the TTS model for `lang` and run one short synthesis.
+
+    The first inference on a fresh model pays one-off setup (CUDA kernels,
+    allocator growth); doing it up front keeps that cost out of the first poem
+    and surfaces model loading errors before any file is processed.
+
+    Returns:
+        The loaded TTS instance
+    """
+    tts = _get_tts_instance(cfg, lang)
+    if id(tts) not in _WARMED_UP:
+        tts.synthesize("hola." if lang == "es" else "hello.")
+        _WARMED_UP.add(id(tts))
+    return tts
+
+
+def _guess_lang(files: List[str], cfg: VideoJobConfig) -> Optional[str]:
+    """Language of the first poem, used to pick which model to warm up."""
+    if cfg.force_lang:
+        return cfg.force_lang
+    try:
+        _, _, text = parse_md_file(files[0])
+    except Exception:
+        return None
+    return detect_language(text)
+
+
+def _prepare_audio(path: str, idx: int, cfg: VideoJobConfig) -> Optional[dict]:
+    """Parse a `.md` file, synthesize its narration and write the poem WAV.
+
+    Returns:
+        Dict with title, author, text, base_name, audio_path and subtitles, or
+        None if the file could not be parsed or its video is already up to date
+    """
+    try:
+        title, author, text = parse_md_file(path)
+    except Exception as e:
+        print(f"Error al parsear {path}: {e}")
+        return None
+
+    raw_name = f"{idx + 1}_{title}"
+    safe_name = sanitize_filename(raw_name)
+    if len(safe_name) > 80:
+        safe_name = safe_name[:80]
+    base_name = safe_name
+
+    if cfg.skip_existing:
+        video_path = os.path.join(cfg.out_dir, base_name + ".mp4")
+        try:
+            if os.path.getmtime(video_path) > os.path.getmtime(path):
+                print(f"Video actualizado, se omite: {video_path}")
+                return None
+        except OSError:
+            pass
+
+    if cfg.force_lang:
+        lang = cfg.force_lang
+    else:
+        lang = detect_language(text)
+
+    lines = split_text_into_lines(text)
+    texts_to_synthesize = [line for line in lines if line.strip()]
+
+    # Generate all uncached lines in a single batch for consistent voice;
+    # the fragments stay in memory and are concatenated without touching disk
+    LOGGER.info(f"Synthesizing {len(texts_to_synthesize)} text segments in batch...")
+    with _TTS_LOCK or nullcontext():
+        tts = _get_tts_instance(cfg, lang)
+        wavs, sr = tts_cache.get_or_synthesize_batch(
+            tts, texts_to_synthesize, lang, cfg.tts_backend, tts.model_name
+        )
+    voiced = iter(wavs)
+
+    audio_chunks = []
+    subtitles = []
+    start_time = 0.0
+    pause = silence(0.5, sr)
+    for line in lines:
+        if line.strip() == "":
+            chunk, sub_text = pause, ""
+        else:
+            chunk, sub_text = next(voiced), line
+        dur = len(chunk) / sr
+        audio_chunks.append(chunk)
+        subtitles.append({"text": sub_text, "start": start_time, "duration": dur})
+        start_time += dur
+
+    if not audio_chunks:
+        return None
+
+    final_audio_path = os.path.join(cfg.out_dir, base_name + ".wav")
+    LOGGER.info(
+        f"Writing {len(audio_chunks)} fragments ({start_time:.2f}s) to {final_audio_path}"
+    )
+    sf.write(final_audio_path, np.concatenate(audio_chunks), sr, subtype="PCM_16")
+
+    return {
+        "title": title,
+        "author": author,
+        "text": text,
+        "base_name": base_name,
+        "audio_path": final_audio_path,
+        "subtitles": subtitles,
+    }
 
 
-def write_silence_wav(path: str, duration: float = 0.6, framerate: int = 22050):
-    """Write a mono 16-bit silent WAV file of given duration (seconds)."""
-    n_frames = int(duration * framerate)
-    with wave.open(path, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(framerate)
-        wf.writeframes(b"\x00\x00" * n_frames)
+def _render_video(job: dict, cfg: VideoJobConfig) -> dict:
+    """Encode the video for a job produced by `_prepare_audio`.
+
+    Returns:
+        Dict with video_path, title, author, text and base_name
+    """
+    video_path = os.path.join(cfg.out_dir, job["base_name"] + ".mp4")
+    create_video_with_subtitles(
+        audio_path=job["audio_path"],
+        subtitles=job["subtitles"],
+        out_path=video_path,
+        title=job["title"],
+        author=job["author"],
+        image_path=cfg.image_path,
+        fps=cfg.fps,
+        resolution=cfg.resolution,
+        fontsize=cfg.font_size,
+        gradient_palette=cfg.gradient_palette,
+        add_particles=cfg.add_particles,
+        num_particles=cfg.num_particles,
+        fade_duration=cfg.fade_duration,
+        tiktok_mode=cfg.tiktok_mode,
+        zoom_background=cfg.zoom_background,
+        add_sparkles=True,
+    )
+
+    return {
+        "video_path": video_path,
+        "title": job["title"],
+        "author": job["author"],
+        "text": job["text"],
+        "base_name": job["base_name"],
+    }
+
+
+def process_one(path: str, idx: int, cfg: VideoJobConfig) -> Optional[dict]:
+    """Render the video for a single `.md` file.
+
+    Args:
+        path: Markdown file to render
+        idx: Position of the file in the run, used to prefix the output name
+        cfg: Shared job settings
+
+    Returns:
+        Dict with video_path, title, author, text and base_name, or None if the
+        file could not be parsed
+    """
+    job = _prepare_audio(path, idx, cfg)
+    if job is None:
+        return None
+    return _render_video(job, cfg)
+
+
+def _process_pipelined(files: List[str], cfg: VideoJobConfig, upload_callback) -> None:
+    """Render `files` in order, overlapping TTS with video encoding.
+
+    Narration is synthesized in this thread while a background thread encodes
+    the previous poem's video, so GPU inference and the CPU-bound MoviePy
+    encode run at the same time. At most `_MAX_PENDING_RENDERS` prepared poems
+    wait for encoding. Errors propagate like in a plain sequential loop.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=1) as render_executor:
+        try:
+            for idx, path in enumerate(files):
+                job = _prepare_audio(path, idx, cfg)
+                if job is not None:
+                    pending.append(render_executor.submit(_render_video, job, cfg))
+                while pending and (
+                    pending[0].done() or len(pending) > _MAX_PENDING_RENDERS
+                ):
+                    _run_upload_callback(upload_callback, pending.popleft().result())
+            while pending:
+                _run_upload_callback(upload_callback, pending.popleft().result())
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+
+
+def _list_markdown_files(input_dir: str) -> List[str]:
+    """Return the `.md` files directly under `input_dir`, sorted by name.
+
+    Hidden files are skipped, matching `glob("*.md")`.
+    """
+    try:
+        with os.scandir(input_dir) as it:
+            names = [
+                entry.name
+                for entry in it
+                if entry.name.endswith(".md")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    return [os.path.join(input_dir, name) for name in sorted(names)]
+
+
+def _run_upload_callback(upload_callback, video_info: Optional[dict]) -> None:
+    # Llamar al callback de upload si está configurado
+    if upload_callback and video_info:
+        try:
+            upload_callback(video_info)
+        except Exception as e:
+            LOGGER.error(f"Error en upload callback: {e}")
 
 
 def main(
@@ -98,10 +450,13 @@ def main(
     tts_reference_wav: Optional[str] = None,
     device: str = "auto",
     tts_model_size: str = "1.7B",
+    tts_precision: str = "auto",
     resolution: tuple = (1080, 1920),
     tiktok_mode: bool = True,
     zoom_background: bool = True,
     upload_callback=None,
+    max_workers: int = 1,
+    skip_existing: bool = False,
 ):
     """Main video generation pipeline reading `.md` files from `input_dir`.
 
@@ -115,208 +470,78 @@ def main(
     Then the poem content from the next line onward.
 
     Args:
+        tts_precision: TTS weights precision: 'auto' (bf16 on CUDA, fp32 on
+                    CPU), 'bf16', 'fp16' or 'fp32'.
         upload_callback: Optional callback function called after each video is generated.
                         Receives dict with: video_path, title, author, text, base_name
+        max_workers: Number of poems rendered concurrently in separate processes.
+                    Each worker loads its own full copy of the TTS model (N
+                    copies in RAM/VRAM), but only one synthesizes at a time
+                    while the others encode video, so more than 2-3 rarely
+                    helps. Default 1 renders in this process, encoding each
+                    video in a background thread while the next poem is
+                    synthesized. The first failing poem stops the run either way.
+        skip_existing: Skip poems whose output video is newer than the `.md`
+                    file, so re-runs only render new or edited poems.
     """
     os.makedirs(out_dir, exist_ok=True)
 
-    pattern = os.path.join(input_dir, "*.md")
-    files = sorted(glob(pattern))
+    files = _list_markdown_files(input_dir)
 
     if not files:
         print(f"No se encontraron archivos .md en: {os.path.abspath(input_dir)}")
         return
 
-    tts_cache = {}
-
-    for idx, path in enumerate(files):
-        try:
-            title, author, text = parse_md_file(path)
-        except Exception as e:
-            print(f"Error al parsear {path}: {e}")
-            continue
-
-        raw_name = f"{idx + 1}_{title}"
-        safe_name = sanitize_filename(raw_name)
-        if len(safe_name) > 80:
-            safe_name = safe_name[:80]
-        base_name = safe_name
-
-        audio_frag_dir = os.path.join(out_dir, base_name + "_frags")
-        os.makedirs(audio_frag_dir, exist_ok=True)
-
-        if force_lang:
-            lang = force_lang
-        else:
-            lang = detect_language(text)
-
-        tts_key = f"{tts_backend}:{lang}:{tts_model or ''}:{tts_reference_wav or ''}:{device}:{tts_model_size}"
-        if tts_key not in tts_cache:
-            tts_cache[tts_key] = get_tts(
-                backend=tts_backend,
-                lang=lang,
-                model_name=tts_model,
-                reference_wav_path=tts_reference_wav,
-                device=device,
-                model_size=tts_model_size,
-            )
-        print(tts_key)
-        tts = tts_cache[tts_key]
-
-        lines = split_text_into_lines(text)
-        fragments = []
-        subtitles = []
-        start_time = 0.0
-
-        # Prepare batch synthesis: collect all non-empty lines and their paths
-        texts_to_synthesize = []
-        paths_to_synthesize = []
-        line_indices = []  # Keep track of which lines are text (not silence)
-
-        for j, line in enumerate(lines):
-            frag_path = os.path.join(audio_frag_dir, f"frag_{j + 1}.wav")
-            if line.strip() == "":
-                # Mark as silence (will be handled separately)
-                line_indices.append((j, None, frag_path))
-            else:
-                texts_to_synthesize.append(line)
-                paths_to_synthesize.append(frag_path)
-                line_indices.append((j, len(texts_to_synthesize) - 1, frag_path))
-
-        # Generate all audios in a single batch for consistent voice
-        if texts_to_synthesize:
-            LOGGER.info(
-                f"Synthesizing {len(texts_to_synthesize)} text segments in batch..."
-            )
-            LOGGER.info(f"Text segments: {texts_to_synthesize}")
-            LOGGER.info(f"Output paths: {paths_to_synthesize}")
-            tts.synthesize_batch_to_files(
-                texts=texts_to_synthesize,
-                out_paths=paths_to_synthesize,
-            )
-            # Verify files were created
-            for path in paths_to_synthesize:
-                if os.path.exists(path):
-                    size = os.path.getsize(path)
-                    LOGGER.info(f"Generated file: {path}, size: {size} bytes")
-                else:
-                    LOGGER.error(f"Missing file: {path}")
-
-        # Process all segments in order (silences and synthesized texts)
-        LOGGER.info(f"Processing {len(line_indices)} segments...")
-        for j, text_idx, frag_path in line_indices:
-            line = lines[j]
-            LOGGER.info(
-                f"Processing segment {j}: text_idx={text_idx}, path={frag_path}"
-            )
-
-            if line.strip() == "":
-                # Silence segment
-                write_silence_wav(frag_path, duration=0.5)
-                clip = AudioFileClip(frag_path)
-                dur = clip.duration
-                LOGGER.info(f"Silence {j}: duration={dur:.2f}s")
-                # Use subclip to ensure moviepy respects the exact duration
-                clip = clip.subclipped(0, dur)
-                fragments.append(clip)
-                subtitles.append({"text": "", "start": start_time, "duration": dur})
-                start_time += dur
-            else:
-                # Text segment (already synthesized)
-                if not os.path.exists(frag_path):
-                    LOGGER.error(f"Audio file missing: {frag_path}")
-                    continue
-                file_size = os.path.getsize(frag_path)
-                LOGGER.info(f"Text {j}: loading {frag_path} ({file_size} bytes)")
-                clip = AudioFileClip(frag_path)
-                LOGGER.info(
-                    f"Text {j}: loaded, duration={clip.duration:.2f}s, fps={clip.fps}"
-                )
-                # Keep full audio - do not trim
-                dur = clip.duration
-                LOGGER.info(
-                    f"Text {j}: final duration={dur:.2f}s, line='{line[:30]}...'"
-                )
-                # Use subclip to ensure moviepy respects the exact duration
-                clip = clip.subclipped(0, dur)
-                fragments.append(clip)
-                subtitles.append({"text": line, "start": start_time, "duration": dur})
-                start_time += dur
-
-        if fragments:
-            total_duration = sum(c.duration for c in fragments)
-            # Check sample rates are consistent
-            sample_rates = [c.fps for c in fragments]
-            LOGGER.info(f"Fragment sample rates: {sample_rates}")
-            if len(set(sample_rates)) > 1:
-                LOGGER.warning(
-                    f"WARNING: Different sample rates detected: {set(sample_rates)}"
-                )
-
-            LOGGER.info(
-                f"Concatenating {len(fragments)} fragments, total duration: {total_duration:.2f}s"
-            )
-            final_audio = concatenate_audioclips(fragments)
-            final_audio_path = os.path.join(out_dir, base_name + ".wav")
-            LOGGER.info(f"Writing final audio to {final_audio_path}")
-            # Write with explicit codec and parameters to avoid truncation
-            final_audio.write_audiofile(
-                final_audio_path,
-                codec="pcm_s16le",  # Standard WAV codec
-                fps=24000,  # Match TTS sample rate
-                nbytes=2,  # 16-bit
-                buffersize=2000,
-            )
-            LOGGER.info(f"Final audio duration: {final_audio.duration:.2f}s")
-            # Verify file was written correctly
-            if os.path.exists(final_audio_path):
-                file_size = os.path.getsize(final_audio_path)
-                LOGGER.info(f"Final audio file size: {file_size} bytes")
-            for c in fragments:
-                c.close()
-            final_audio.close()
-
-            video_path = os.path.join(out_dir, base_name + ".mp4")
-            create_video_with_subtitles(
-                audio_path=final_audio_path,
-                subtitles=subtitles,
-                out_path=video_path,
-                title=title,
-                author=author,
-                image_path=image_path,
-                fps=fps,
-                resolution=resolution,
-                fontsize=font_size,
-                gradient_palette=gradient_palette,
-                add_particles=add_particles,
-                num_particles=num_particles,
-                fade_duration=fade_duration,
-                tiktok_mode=tiktok_mode,
-                zoom_background=zoom_background,
-                add_sparkles=True,
-            )
-
-            # Llamar al callback de upload si está configurado
-            if upload_callback:
-                try:
-                    upload_callback(
-                        {
-                            "video_path": video_path,
-                            "title": title,
-                            "author": author,
-                            "text": text,
-                            "base_name": base_name,
-                        }
-                    )
-                except Exception as e:
-                    LOGGER.error(f"Error en upload callback: {e}")
+    cfg = VideoJobConfig(
+        out_dir=out_dir,
+        image_path=image_path,
+        gradient_palette=gradient_palette,
+        add_particles=add_particles,
+        font_size=font_size,
+        fade_duration=fade_duration,
+        force_lang=force_lang,
+        fps=fps,
+        num_particles=num_particles,
+        tts_backend=tts_backend,
+        tts_model=tts_model,
+        tts_reference_wav=tts_reference_wav,
+        device=device,
+        tts_model_size=tts_model_size,
+        tts_precision=tts_precision,
+        resolution=resolution,
+        tiktok_mode=tiktok_mode,
+        zoom_background=zoom_background,
+        skip_existing=skip_existing,
+    )
 
+    lang = _guess_lang(files, cfg)
+    workers = min(max_workers, len(files))
+    if workers <= 1:
+        if lang:
+            warm_up(cfg, lang)
+        _process_pipelined(files, cfg, upload_callback)
+    else:
+        # Spawned (not forked) workers so CUDA initializes cleanly in each one;
+        # the upload callback stays in this process, it is usually a closure
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(ctx.Lock(), cfg, lang),
+        ) as executor:
+            futures = {
+                executor.submit(process_one, path, idx, cfg): path
+                for idx, path in enumerate(files)
+            }
+            # Fail like the sequential path: stop at the first error
             try:
-                for f in os.listdir(audio_frag_dir):
-                    os.remove(os.path.join(audio_frag_dir, f))
-                os.rmdir(audio_frag_dir)
-            except Exception:
-                pass
+                for future in as_completed(futures):
+                    _run_upload_callback(upload_callback, future.result())
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     print(f"Generados videos en: {os.path.abspath(out_dir)}")
 
@@ -355,12 +580,29 @@ if __name__ == "__main__":
     parser.add_argument(
         "--tts-model-size", default="1.7B", help="Tamaño del modelo TTS"
     )
+    parser.add_argument(
+        "--tts-precision",
+        default="auto",
+        help="Precisión del modelo TTS (auto, bf16, fp16, fp32)",
+    )
     parser.add_argument(
         "--vertical", action="store_true", default=True, help="Formato vertical"
     )
     parser.add_argument(
         "--no-zoom", action="store_true", help="Desactivar zoom de fondo"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Poemas procesados en paralelo (cada proceso carga su propia copia "
+        "del modelo TTS en memoria/VRAM; solo uno sintetiza a la vez)",
+    )
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Omitir poemas cuyo video es más reciente que el .md",
+    )
     args = parser.parse_args()
 
     resolution = (1080, 1920) if args.vertical else (1280, 720)
@@ -381,7 +623,10 @@ if __name__ == "__main__":
         tts_reference_wav=args.tts_reference_wav,
         device=args.device,
         tts_model_size=args.tts_model_size,
+        tts_precision=args.tts_precision,
         resolution=resolution,
         tiktok_mode=True,
         zoom_background=not args.no_zoom,
+        max_workers=args.workers,
+        skip_existing=args.skip_existing,
     )
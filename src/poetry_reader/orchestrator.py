@@ -9,16 +9,23 @@ import glob
 import logging
 import random
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
-from .drive.manager import DriveManager
+from .drive.manager import DriveManager, FileInfo
 from .drive.tracker import ExcelTracker
 from .generate_videos import main as generate_video
 from .utils import parse_markdown_file
 
+# Generated videos allowed to wait for upload before generation pauses
+# (never fewer than the number of upload workers)
+_MAX_PENDING_UPLOADS = 2
+
 # Configure logging to show INFO messages
 logging.basicConfig(
     level=logging.INFO,
@@ -108,8 +115,17 @@ class VideoOrchestrator:
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.temp_md_dir.mkdir(parents=True, exist_ok=True)
 
-        # YouTube uploader (initialized on demand)
+        # YouTube uploader (initialized on demand). Its client shares one
+        # httplib2.Http, so upload threads take turns using it.
         self._youtube_uploader = None
+        self._youtube_lock = threading.RLock()
+
+        # Videos uploaded concurrently while the next ones are generated
+        processing_config = config.get("processing", {})
+        self.upload_concurrency = max(1, processing_config.get("upload_concurrency", 1))
+
+        # Existing videos in the Drive output folder, listed once per run
+        self._existing_videos: Optional[Dict[str, FileInfo]] = None
 
     def process_all(
         self,
@@ -194,6 +210,15 @@ class VideoOrchestrator:
             markdowns_folder_id, str(self.temp_md_dir), files_list
         )
 
+        # Register files missing from the tracker in a single batch
+        new_files = [
+            filename
+            for filename in dict.fromkeys(files_list)
+            if filename in downloaded_files
+            and self.tracker.get_index_by_filename(filename) is None
+        ]
+        self.tracker.add_new_files(new_files)
+
         # Build pending list with file content
         pending = []
         for filename in files_list:
@@ -202,11 +227,7 @@ class VideoOrchestrator:
                 continue
 
             local_path = downloaded_files[filename]
-
-            # Add to tracker if not exists, or get existing index
             index = self.tracker.get_index_by_filename(filename)
-            if index is None:
-                index = self.tracker.add_new_file(filename)
 
             try:
                 markdown_data = self._parse_markdown_file(index, local_path)
@@ -228,76 +249,84 @@ class VideoOrchestrator:
 
         print(f"[poetry-reader] Markdowns to process: {len(pending)}\n")
 
-        # Process each markdown
-        results = []
-        successful = 0
-        failed = 0
-        skipped = 0
+        if upload_to_drive and not dry_run:
+            self._prefetch_existing_videos()
 
-        for i, markdown_data in enumerate(pending, 1):
-            print(f"\n[{i}/{len(pending)}] Processing: '{markdown_data['titulo']}'")
-            print(f"  Author: {markdown_data['autor']}")
-            print(
-                f"  [DEBUG] About to call process_single_markdown for index {markdown_data['index']}"
-            )
+        # Process each markdown: videos are generated here, one at a time,
+        # while the previous ones upload in the background
+        results = []
+        # Whether the tracker on Drive matches the last local save
+        tracker_uploaded = True
+        in_flight = deque()
+        max_pending = max(_MAX_PENDING_UPLOADS, self.upload_concurrency)
+
+        with ThreadPoolExecutor(
+            max_workers=self.upload_concurrency
+        ) as publish_executor:
+            for i, markdown_data in enumerate(pending, 1):
+                print(f"\n[{i}/{len(pending)}] Processing: '{markdown_data['titulo']}'")
+                print(f"  Author: {markdown_data['autor']}")
+
+                if dry_run:
+                    print("  [DRY RUN] Skipping actual processing")
+                    results.append(
+                        ProcessingResult(
+                            titulo=markdown_data["titulo"],
+                            autor=markdown_data["autor"],
+                            status="skipped",
+                        )
+                    )
+                    continue
 
-            if dry_run:
-                print("  [DRY RUN] Skipping actual processing")
-                results.append(
-                    ProcessingResult(
-                        titulo=markdown_data["titulo"],
-                        autor=markdown_data["autor"],
-                        status="skipped",
+                start = datetime.now()
+                try:
+                    video_file = self._generate_stage(markdown_data)
+                    future = publish_executor.submit(
+                        self._publish_stage,
+                        markdown_data,
+                        video_file,
+                        upload_to_drive,
+                        upload_to_youtube,
+                        youtube_privacy,
+                        share=False,
                     )
-                )
-                skipped += 1
-                continue
+                except Exception as e:
+                    future = Future()
+                    future.set_exception(e)
+                in_flight.append((markdown_data, start, future))
 
-            # Process the markdown
-            result = self.process_single_markdown(
-                markdown_data,
-                upload_to_drive=upload_to_drive,
-                upload_to_youtube=upload_to_youtube,
-                youtube_privacy=youtube_privacy,
-            )
-            results.append(result)
+                # Record finished uploads in order, and wait once too many pile up
+                while in_flight and (
+                    in_flight[0][2].done() or len(in_flight) > max_pending
+                ):
+                    results.append(self._collect_result(*in_flight.popleft()))
+                    tracker_uploaded = self._checkpoint_tracker(tracker_uploaded)
 
-            if result.status == "success":
-                successful += 1
-            elif result.status == "failed":
-                failed += 1
-            else:
-                skipped += 1
+            while in_flight:
+                results.append(self._collect_result(*in_flight.popleft()))
+                tracker_uploaded = self._checkpoint_tracker(tracker_uploaded)
 
-            # Save tracker after each processing (incremental saves)
-            try:
-                self.tracker.save()
-                print("[poetry-reader] ✓ Tracker saved locally")
+        if upload_to_drive and not dry_run:
+            self._share_uploaded_videos(results)
 
-                # Upload tracker to Drive immediately after each video
-                excel_file_id = self.drive_config.get("excel_tracker_id")
-                if excel_file_id:
-                    try:
-                        self.drive_manager.update_file(
-                            excel_file_id, self.tracker.excel_path
-                        )
-                        print("[poetry-reader] ✓ Tracker uploaded to Drive")
-                    except Exception as e:
-                        print(f"  [WARNING] Failed to upload tracker to Drive: {e}")
-            except Exception as e:
-                print(f"  [WARNING] Failed to save tracker: {e}")
+        successful = sum(r.status == "success" for r in results)
+        failed = sum(r.status == "failed" for r in results)
+        skipped = len(results) - successful - failed
 
         # Final save and upload
         if not dry_run:
             print("\n" + "-" * 60)
             print("Finalizing...")
             try:
-                self.tracker.save()
-                print("[poetry-reader] ✓ Tracker saved locally")
+                if self.tracker.save():
+                    print("[poetry-reader] ✓ Tracker saved locally")
+                    tracker_uploaded = False
+                else:
+                    print("[poetry-reader] ✓ Tracker already saved")
 
-                # Upload updated tracker to Drive
+                # Upload updated tracker to Drive unless the loop already did
                 excel_file_id = self.drive_config.get("excel_tracker_id")
-                if excel_file_id:
+                if excel_file_id and not tracker_uploaded:
                     self.drive_manager.update_file(
                         excel_file_id, self.tracker.excel_path
                     )
@@ -341,113 +370,176 @@ class VideoOrchestrator:
             ProcessingResult with outcome
         """
         start_time = datetime.now()
-        index = markdown_data["index"]
+        future = Future()
+        try:
+            video_file = self._generate_stage(markdown_data)
+            future.set_result(
+                self._publish_stage(
+                    markdown_data,
+                    video_file,
+                    upload_to_drive,
+                    upload_to_youtube,
+                    youtube_privacy,
+                )
+            )
+        except Exception as e:
+            future.set_exception(e)
+        return self._collect_result(markdown_data, start_time, future)
+
+    def _generate_stage(self, markdown_data: Dict[str, Any]) -> Path:
+        """
+        Generate the video for a markdown and locate the output file.
+
+        Args:
+            markdown_data: Dict with keys: index, autor, titulo, texto, filepath
+
+        Returns:
+            Path to the generated video
+
+        Raises:
+            OrchestratorError: If generation fails or the video is not found
+        """
         titulo = markdown_data["titulo"]
-        autor = markdown_data["autor"]
         md_file = Path(markdown_data["filepath"])
 
-        try:
-            print(f"  → Processing markdown: {md_file.name}")
-            print(f"  [DEBUG] Starting video generation for index {index}")
-
-            # Generate video
-            print("  → Generating video...")
-            self._generate_video(md_file)
-            print("  [DEBUG] Video generation completed", flush=True)
-
-            # Find generated video file
-            print(f"  [DEBUG] Looking for video file with title: {titulo}")
-            video_file = self._find_generated_video(titulo)
-            print(f"  [DEBUG] Found video file: {video_file}")
-            if not video_file or not video_file.exists():
-                raise OrchestratorError("Video file not found after generation")
-
-            print(f"  → Video generated: {video_file.name}")
-
-            video_id = None
-            video_url = None
-
-            if upload_to_drive:
-                print("  [DEBUG] About to start upload process")
-
-                # Upload video to Drive
-                videos_folder_id = self.drive_config.get("videos_output_folder_id")
-                if not videos_folder_id:
-                    raise OrchestratorError(
-                        "videos_output_folder_id not configured in drive config"
-                    )
+        print(f"  → Processing markdown: {md_file.name}")
+
+        # Each tracker row renders into its own directory: the file name only
+        # depends on the title, and an earlier video with the same title may
+        # still be uploading in the background
+        job_dir = self.output_dir / f"row_{markdown_data['index']}"
+        job_dir.mkdir(parents=True, exist_ok=True)
+        for stale in job_dir.glob("*.mp4"):
+            stale.unlink()
+
+        # Generate video
+        print("  → Generating video...")
+        self._generate_video(md_file, job_dir)
+
+        # Find generated video file
+        video_file = self._find_generated_video(titulo, job_dir)
+        if not video_file or not video_file.exists():
+            raise OrchestratorError("Video file not found after generation")
+
+        print(f"  → Video generated: {video_file.name}")
+        return video_file
+
+    def _publish_stage(
+        self,
+        markdown_data: Dict[str, Any],
+        video_file: Path,
+        upload_to_drive: bool,
+        upload_to_youtube: bool,
+        youtube_privacy: str,
+        share: bool = True,
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Upload a generated video to Drive and, optionally, YouTube.
+
+        Does not touch the tracker, so it can run on a worker thread.
 
-                print("  → Uploading to Drive...")
+        Args:
+            markdown_data: Dict with keys: index, autor, titulo, texto, filepath
+            video_file: Path to the generated video
+            upload_to_drive: Whether to upload to Google Drive
+            upload_to_youtube: Whether to also upload to YouTube
+            youtube_privacy: YouTube video privacy setting
+            share: Whether to make the video shareable now; batch callers
+                pass False and share all uploads at once afterwards
 
-                # Check if file already exists and delete it to avoid multiple versions
-                existing_file = self.drive_manager.find_file_by_name(
-                    videos_folder_id, video_file.name
+        Returns:
+            Tuple of (Drive file ID, shareable link), both None if the Drive
+            upload is disabled; the link is None when `share` is False
+
+        Raises:
+            OrchestratorError: If the Drive upload fails
+        """
+        titulo = markdown_data["titulo"]
+        video_id = None
+        video_url = None
+
+        if upload_to_drive:
+            # Upload video to Drive
+            videos_folder_id = self.drive_config.get("videos_output_folder_id")
+            if not videos_folder_id:
+                raise OrchestratorError(
+                    "videos_output_folder_id not configured in drive config"
                 )
-                if existing_file:
-                    print(f"  → Replacing existing file: {video_file.name}")
-                    self.drive_manager.delete_file(existing_file.id)
 
-                print(
-                    f"  → Uploading {video_file.name} to folder {videos_folder_id}..."
+            print(f"  → Uploading {video_file.name} to Drive...")
+
+            # Check if file already exists and delete it to avoid multiple versions
+            existing_file = self._find_existing_video(videos_folder_id, video_file.name)
+            if existing_file:
+                print(f"  → Replacing existing file: {video_file.name}")
+                self.drive_manager.delete_file(existing_file.id)
+                if self._existing_videos is not None:
+                    self._existing_videos.pop(video_file.name, None)
+
+            try:
+                video_id = self.drive_manager.upload_file(
+                    str(video_file), videos_folder_id, video_file.name
                 )
-                try:
-                    video_id = self.drive_manager.upload_file(
-                        str(video_file), videos_folder_id, video_file.name
+                if self._existing_videos is not None:
+                    self._existing_videos[video_file.name] = FileInfo(
+                        id=video_id, title=video_file.name, mimeType="video/mp4"
                     )
-                    print(f"  → Video uploaded with ID: {video_id}")
-                except Exception as upload_error:
-                    print(f"  ✗ Upload failed: {upload_error}")
-                    raise OrchestratorError(f"Failed to upload video: {upload_error}")
+            except Exception as upload_error:
+                print(f"  ✗ Upload failed: {upload_error}")
+                raise OrchestratorError(f"Failed to upload video: {upload_error}")
 
-                # Get shareable link for reporting (not saved to Excel)
+            # Get shareable link for reporting (not saved to Excel)
+            if share:
                 try:
                     video_url = self.drive_manager.get_shareable_link(video_id)
-                    print(f"  → Shareable link: {video_url}")
                 except Exception as link_error:
                     print(f"  [WARNING] Could not get shareable link: {link_error}")
                     video_url = f"https://drive.google.com/file/d/{video_id}"
+        else:
+            print("  [INFO] Upload disabled - video saved locally only")
 
-                # Mark as processed in tracker
-                self.tracker.mark_processed(index, video_id)
-            else:
-                print("  [INFO] Upload disabled - video saved locally only")
-                # Mark as processed without video_id
-                self.tracker.mark_processed(index, "LOCAL_ONLY")
+        # Upload to YouTube if enabled
+        if upload_to_youtube:
+            try:
+                youtube_video_id = self._upload_to_youtube(
+                    str(video_file),
+                    titulo,
+                    markdown_data["autor"],
+                    markdown_data.get("texto", ""),
+                    youtube_privacy,
+                )
+                print(f"  → YouTube URL: https://youtu.be/{youtube_video_id}")
+            except Exception as yt_error:
+                print(f"  [WARNING] YouTube upload failed for '{titulo}': {yt_error}")
+                # Don't fail the whole process if YouTube upload fails
 
-            # Upload to YouTube if enabled
-            if upload_to_youtube:
-                try:
-                    print("  → Uploading to YouTube...")
-                    youtube_video_id = self._upload_to_youtube(
-                        str(video_file),
-                        titulo,
-                        autor,
-                        markdown_data.get("texto", ""),
-                        youtube_privacy,
-                    )
-                    print(f"  → YouTube video ID: {youtube_video_id}")
-                    print(f"  → YouTube URL: https://youtu.be/{youtube_video_id}")
-                except Exception as yt_error:
-                    print(f"  [WARNING] YouTube upload failed: {yt_error}")
-                    # Don't fail the whole process if YouTube upload fails
+        return video_id, video_url
 
-            # Cleanup - no need to delete downloaded files, they stay in temp_md_dir
+    def _collect_result(
+        self, markdown_data: Dict[str, Any], start_time: datetime, future: Future
+    ) -> ProcessingResult:
+        """
+        Wait for a markdown's publish stage and record the outcome in the tracker.
 
-            duration = (datetime.now() - start_time).total_seconds()
-            print(f"  ✓ Success! (Duration: {duration:.1f}s)")
+        Args:
+            markdown_data: Dict with keys: index, autor, titulo, texto, filepath
+            start_time: When processing of this markdown started
+            future: Future resolving to the `_publish_stage` result
 
-            return ProcessingResult(
-                titulo=titulo,
-                autor=autor,
-                status="success",
-                video_id=video_id,
-                video_url=video_url,
-                duration_seconds=duration,
-            )
+        Returns:
+            ProcessingResult with outcome
+        """
+        index = markdown_data["index"]
+        titulo = markdown_data["titulo"]
+        autor = markdown_data["autor"]
 
+        try:
+            video_id, video_url = future.result()
+            # Mark as processed in tracker (without video_id if upload is disabled)
+            self.tracker.mark_processed(index, video_id or "LOCAL_ONLY")
         except Exception as e:
             error_msg = str(e)
-            print(f"  ✗ Failed: {error_msg}")
+            print(f"  ✗ Failed '{titulo}': {error_msg}")
 
             # Mark as failed in tracker
             try:
@@ -456,7 +548,6 @@ class VideoOrchestrator:
                 print(f"  [WARNING] Failed to mark as failed: {tracker_error}")
 
             duration = (datetime.now() - start_time).total_seconds()
-
             return ProcessingResult(
                 titulo=titulo,
                 autor=autor,
@@ -465,6 +556,102 @@ class VideoOrchestrator:
                 duration_seconds=duration,
             )
 
+        duration = (datetime.now() - start_time).total_seconds()
+        print(f"  ✓ Success: '{titulo}' (Duration: {duration:.1f}s)")
+        if video_url:
+            print(f"  → Shareable link: {video_url}")
+
+        return ProcessingResult(
+            titulo=titulo,
+            autor=autor,
+            status="success",
+            video_id=video_id,
+            video_url=video_url,
+            duration_seconds=duration,
+        )
+
+    def _share_uploaded_videos(self, results: List[ProcessingResult]) -> None:
+        """
+        Make every uploaded video shareable with one batched request.
+
+        Fills in `video_url` on the successful results in place.
+
+        Args:
+            results: Results of the processed markdowns
+        """
+        uploaded = [r for r in results if r.status == "success" and r.video_id]
+        if not uploaded:
+            return
+
+        try:
+            links = self.drive_manager.batch_get_shareable_links(
+                [r.video_id for r in uploaded]
+            )
+        except Exception as e:
+            print(f"[WARNING] Could not get shareable links: {e}")
+            links = {}
+
+        for r in uploaded:
+            if r.video_id not in links:
+                print(f"  [WARNING] Could not share '{r.titulo}'")
+            r.video_url = links.get(
+                r.video_id, f"https://drive.google.com/file/d/{r.video_id}"
+            )
+        print(f"[poetry-reader] ✓ Shared {len(links)}/{len(uploaded)} uploaded videos")
+
+    def _checkpoint_tracker(self, tracker_uploaded: bool) -> bool:
+        """
+        Save the tracker locally and upload it to Drive if anything changed.
+
+        Args:
+            tracker_uploaded: Whether Drive currently matches the last local save
+
+        Returns:
+            Whether Drive matches the last local save afterwards
+        """
+        try:
+            if not self.tracker.save():
+                return tracker_uploaded
+            print("[poetry-reader] ✓ Tracker saved locally")
+        except Exception as e:
+            print(f"  [WARNING] Failed to save tracker: {e}")
+            return tracker_uploaded
+
+        # Upload tracker to Drive immediately after each video
+        excel_file_id = self.drive_config.get("excel_tracker_id")
+        if not excel_file_id:
+            return False
+        try:
+            self.drive_manager.update_file(excel_file_id, self.tracker.excel_path)
+            print("[poetry-reader] ✓ Tracker uploaded to Drive")
+            return True
+        except Exception as e:
+            print(f"  [WARNING] Failed to upload tracker to Drive: {e}")
+            return False
+
+    def _prefetch_existing_videos(self) -> None:
+        """List the videos output folder once so per-video lookups stay local."""
+        videos_folder_id = self.drive_config.get("videos_output_folder_id")
+        if not videos_folder_id:
+            return
+
+        try:
+            files = self.drive_manager.list_files_in_folder(videos_folder_id)
+            self._existing_videos = {f.title: f for f in files}
+            print(
+                f"[poetry-reader] {len(self._existing_videos)} videos already in Drive folder"
+            )
+        except Exception as e:
+            # Fall back to per-video lookups
+            print(f"  [WARNING] Could not list videos folder: {e}")
+            self._existing_videos = None
+
+    def _find_existing_video(self, folder_id: str, filename: str) -> Optional[FileInfo]:
+        """Find a video in the output folder, using the prefetched listing if any."""
+        if self._existing_videos is not None:
+            return self._existing_videos.get(filename)
+        return self.drive_manager.find_file_by_name(folder_id, filename)
+
     def _get_random_background_image(self) -> Optional[str]:
         """Get a random background image from the images folder.
 
@@ -494,12 +681,13 @@ class VideoOrchestrator:
 
         return selected_image
 
-    def _generate_video(self, markdown_file: Path) -> None:
+    def _generate_video(self, markdown_file: Path, out_dir: Path) -> None:
         """
         Generate video from markdown file using generate_videos.main().
 
         Args:
             markdown_file: Path to markdown file
+            out_dir: Directory the video is written to
 
         Raises:
             OrchestratorError: If video generation fails
@@ -530,7 +718,7 @@ class VideoOrchestrator:
             try:
                 generate_video(
                     input_dir=str(temp_input_dir),
-                    out_dir=str(self.output_dir),
+                    out_dir=str(out_dir),
                     image_path=image_path,
                     gradient_palette=self.video_config.get("gradient_palette"),
                     add_particles=self.video_config.get("add_particles", True),
@@ -544,6 +732,7 @@ class VideoOrchestrator:
                     tts_reference_wav=self.video_config.get("tts_reference_wav"),
                     device=self.video_config.get("device", "auto"),
                     tts_model_size=self.video_config.get("tts_model_size", "1.7B"),
+                    tts_precision=self.video_config.get("tts_precision", "auto"),
                     resolution=resolution,
                     tiktok_mode=self.video_config.get("tiktok_mode", True),
                     zoom_background=self.video_config.get("zoom_background", True),
@@ -562,18 +751,19 @@ class VideoOrchestrator:
             print(f"  [DEBUG] Exception in _generate_video: {e}")
             raise OrchestratorError(f"Video generation failed: {str(e)}") from e
 
-    def _find_generated_video(self, titulo: str) -> Optional[Path]:
+    def _find_generated_video(self, titulo: str, out_dir: Path) -> Optional[Path]:
         """
         Find the generated video file in output directory.
 
         Args:
             titulo: Title of the video (used to match filename)
+            out_dir: Directory the video was generated into
 
         Returns:
             Path to video file or None if not found
         """
         # Look for .mp4 files in output directory
-        mp4_files = list(self.output_dir.glob("*.mp4"))
+        mp4_files = list(out_dir.glob("*.mp4"))
 
         if not mp4_files:
             return None
@@ -610,10 +800,11 @@ class VideoOrchestrator:
 
     def _get_or_create_youtube_uploader(self):
         """Get or create YouTube uploader instance."""
-        if self._youtube_uploader is None:
-            from .youtube import YouTubeUploader
+        with self._youtube_lock:
+            if self._youtube_uploader is None:
+                from .youtube import YouTubeUploader
 
-            self._youtube_uploader = YouTubeUploader()
+                self._youtube_uploader = YouTubeUploader()
         return self._youtube_uploader
 
     def _upload_to_youtube(
@@ -637,20 +828,20 @@ class VideoOrchestrator:
         Returns:
             YouTube video ID
         """
-        uploader = self._get_or_create_youtube_uploader()
-
         # Construir título y descripción
         youtube_title = f"{titulo} - {autor}"
         youtube_description = f"{titulo}\n{autor}\n\n{texto}"
 
-        response = uploader.upload_video(
-            video_path=video_path,
-            title=youtube_title,
-            description=youtube_description,
-            privacy_status=privacy,
-            category_id="27",  # Education
-            tags=["poetry", "poem", "spoken word", "literature"],
-        )
+        with self._youtube_lock:
+            uploader = self._get_or_create_youtube_uploader()
+            response = uploader.upload_video(
+                video_path=video_path,
+                title=youtube_title,
+                description=youtube_description,
+                privacy_status=privacy,
+                category_id="27",  # Education
+                tags=["poetry", "poem", "spoken word", "literature"],
+            )
 
         return response.get("id")
 
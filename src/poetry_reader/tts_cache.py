@@ -0,0 +1,139 @@
+"""
+On-disk cache of synthesized TTS lines.
+
+Lines are keyed by backend, model, weights dtype, language, reference voice
+and the whitespace-normalized text, so refrains, repeated titles and re-runs
+over the same poems skip model inference entirely.
+
+Entries live under `$XDG_CACHE_HOME/poetry_reader/tts` (`~/.cache/...` by
+default). The cache has no size limit or eviction; it is safe to delete the
+directory at any time to reclaim space, at the cost of re-synthesizing lines.
+"""
+
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import soundfile as sf
+
+LOGGER = logging.getLogger(__name__)
+
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "poetry_reader"
+    / "tts"
+)
+
+
+def normalize_line(text: str) -> str:
+    """Collapse runs of whitespace so equivalent lines share a cache entry."""
+    return " ".join(text.split())
+
+
+def cache_key(
+    text: str,
+    lang: str,
+    backend: str,
+    model: Optional[str],
+    reference_wav: Optional[str] = None,
+    dtype: Optional[str] = None,
+) -> str:
+    """Return the hex digest identifying a synthesized line.
+
+    The reference voice is part of the key (path, size and mtime), so
+    regenerating it invalidates earlier audio. So is the resolved weights
+    dtype, since bf16/fp16 and fp32 runs produce different audio.
+    """
+    voice = ""
+    if reference_wav:
+        try:
+            st = os.stat(reference_wav)
+            voice = f"{os.path.abspath(reference_wav)}:{st.st_size}:{st.st_mtime_ns}"
+        except OSError:
+            voice = reference_wav
+    raw = "|".join(
+        [backend, model or "", dtype or "", lang, voice, normalize_line(text)]
+    )
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return _CACHE_DIR / key[:2] / f"{key}.wav"
+
+
+@lru_cache(maxsize=512)
+def _load(key: str) -> Tuple[np.ndarray, int]:
+    """Read a cached line; raises FileNotFoundError on a miss (not memoized)."""
+    audio, sr = sf.read(str(_entry_path(key)), dtype="float32")
+    audio.flags.writeable = False
+    return audio, sr
+
+
+def _store(key: str, audio: np.ndarray, sr: int) -> None:
+    """Write a line to the cache atomically; failures only cost a future miss."""
+    path = _entry_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        sf.write(str(tmp_path), audio, sr, format="WAV", subtype="FLOAT")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        LOGGER.warning("Could not write TTS cache entry %s: %s", path, exc)
+
+
+def get_or_synthesize_batch(
+    tts: Any,
+    texts: List[str],
+    lang: str,
+    backend: str,
+    model: Optional[str],
+) -> Tuple[List[np.ndarray], int]:
+    """Return audio for `texts`, synthesizing only the lines not cached yet.
+
+    Misses are sent to `tts.synthesize_batch` in a single call so they still
+    share one voice-cloned batch.
+
+    Args:
+        tts: TTS wrapper exposing `synthesize_batch(texts)` and `sr`
+        texts: Lines to synthesize
+        lang: Language code
+        backend: TTS backend name
+        model: Resolved model name
+
+    Returns:
+        Tuple of (list of float32 waveforms in the order of `texts`, sample rate)
+    """
+    reference_wav = getattr(tts, "reference_wav_path", None)
+    dtype = getattr(tts, "dtype", None)
+    dtype = str(dtype) if dtype is not None else None
+    keys = [cache_key(t, lang, backend, model, reference_wav, dtype) for t in texts]
+    results: List[Optional[np.ndarray]] = [None] * len(texts)
+    sr = tts.sr
+
+    misses = {}  # key -> normalized text, deduplicated
+    for i, key in enumerate(keys):
+        try:
+            results[i], sr = _load(key)
+        except (OSError, RuntimeError):
+            # soundfile raises RuntimeError/LibsndfileError on unreadable files
+            misses.setdefault(key, normalize_line(texts[i]))
+
+    if misses:
+        LOGGER.info(
+            "TTS cache: %d hit(s), %d to synthesize",
+            len(texts) - len(misses),
+            len(misses),
+        )
+        wavs, sr = tts.synthesize_batch(list(misses.values()))
+        fresh = dict(zip(misses, wavs))
+        for key, audio in fresh.items():
+            _store(key, audio, sr)
+        for i, key in enumerate(keys):
+            if results[i] is None:
+                results[i] = fresh[key]
+
+    return results, sr
@@ -1,11 +1,50 @@
 import os
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple
 from pathlib import Path
 import torch
 
 LOGGER = logging.getLogger(__name__)
 
+_PRECISIONS = {
+    "bf16": torch.bfloat16,
+    "fp16": torch.float16,
+    "fp32": torch.float32,
+}
+
+
+def resolve_device(device: str) -> str:
+    """Resolve 'auto' to the device the model will actually be loaded on."""
+    if device == "auto":
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    return device
+
+
+def resolve_model_name(model_name: Optional[str], model_size: str = "1.7B") -> str:
+    """Return `model_name`, or the Base model matching `model_size` if unset."""
+    if model_name:
+        return model_name
+    if model_size == "0.6B":
+        return "Qwen/Qwen3-TTS-12Hz-0.6B-Base"
+    return "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
+
+
+def _resolve_dtype(precision: str, device: str) -> torch.dtype:
+    """Map a precision name to a torch dtype.
+
+    "auto" uses bfloat16 on CUDA and float32 elsewhere: CPUs without native
+    bf16 support emulate it, which is slower than plain float32.
+    """
+    if precision == "auto":
+        return torch.bfloat16 if device.startswith("cuda") else torch.float32
+    try:
+        return _PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(
+            f"Unknown precision: {precision!r} "
+            f"(expected 'auto' or one of {', '.join(_PRECISIONS)})"
+        ) from None
+
 
 class Qwen3TTSWrapper:
     """Wrapper for Qwen3-TTS Base model with voice cloning from reference audio.
@@ -32,6 +71,7 @@ class Qwen3TTSWrapper:
         device: str = "auto",
         reference_wav_path: Optional[str] = None,
         model_name: str = "Qwen/Qwen3-TTS-12Hz-1.7B-Base",
+        precision: str = "auto",
     ):
         """Initialize Qwen3-TTS Base model for voice cloning.
 
@@ -40,6 +80,8 @@ class Qwen3TTSWrapper:
             device: Device to use ('auto', 'cpu', 'cuda', 'cuda:0', etc.)
             reference_wav_path: Path to reference WAV file (REQUIRED)
             model_name: Qwen3-TTS model to use (should be Base model)
+            precision: Model weights precision: 'auto' (bf16 on CUDA, fp32 on
+                CPU), 'bf16', 'fp16' or 'fp32'
 
         Raises:
             ValueError: If reference_wav_path is not provided or file doesn't exist
@@ -79,17 +121,19 @@ class Qwen3TTSWrapper:
             LOGGER.info(f"Reference WAV path: {reference_wav_path}")
             from qwen_tts import Qwen3TTSModel
 
-            if device == "auto":
-                device = "cuda" if torch.cuda.is_available() else "cpu"
+            device = resolve_device(device)
             self.device = device
             LOGGER.info(f"Using device: {device}")
 
             # Load only the Base model for voice cloning
-            # For CUDA, use bfloat16 to reduce VRAM usage (half precision)
+            # For CUDA, half precision halves VRAM usage and speeds up inference
+            dtype = _resolve_dtype(precision, device)
+            self.dtype = dtype
+            LOGGER.info(f"Using dtype: {dtype}")
             self.model = Qwen3TTSModel.from_pretrained(
                 model_name,
                 device_map=device,
-                dtype=torch.bfloat16,
+                dtype=dtype,
                 attn_implementation="eager",
             )
 
@@ -135,6 +179,18 @@ class Qwen3TTSWrapper:
 
         LOGGER.info("Voice clone prompt created successfully from reference file")
 
+    def synthesize(self, text: str) -> Tuple[Any, int]:
+        """Generate audio for a single text and return it in memory.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            Tuple of (mono float32 waveform, sample rate)
+        """
+        wavs, sr = self.synthesize_batch([text])
+        return wavs[0], sr
+
     def synthesize_to_file(self, text: str, out_path: str):
         """Generate audio for a single text and save to file.
 
@@ -147,30 +203,29 @@ class Qwen3TTSWrapper:
             out_paths=[out_path],
         )
 
-    def synthesize_batch_to_files(
-        self, texts: List[str], out_paths: List[str], batch_size: int = 5
-    ):
+    def synthesize_batch(
+        self, texts: List[str], batch_size: int = 5
+    ) -> Tuple[List[Any], int]:
         """Generate audio for multiple texts with consistent voice using voice cloning.
 
         This method ensures all texts are synthesized with the exact same voice
         by using a cached voice clone prompt from the reference audio.
-        Processes texts in batches to avoid CUDA out of memory errors.
+        Processes texts in batches to avoid CUDA out of memory errors; texts
+        are grouped by length so each batch pads as little as possible.
 
         Args:
             texts: List of texts to synthesize
-            out_paths: List of output audio file paths (must match texts length)
             batch_size: Number of texts to process per batch (default: 5)
-        """
-        import soundfile as sf
 
-        if len(texts) != len(out_paths):
-            raise ValueError(
-                f"Number of texts ({len(texts)}) must match number of out_paths ({len(out_paths)})"
-            )
+        Returns:
+            Tuple of (list of mono float32 waveforms in the order of `texts`,
+            sample rate)
+        """
+        import numpy as np
 
         if not texts:
             LOGGER.warning("No texts provided for synthesis")
-            return
+            return [], self.sr
 
         if self._voice_clone_prompt is None:
             raise RuntimeError(
@@ -178,23 +233,23 @@ class Qwen3TTSWrapper:
                 "the prompt should have been created during initialization."
             )
 
-        # Create output directories
-        for out_path in out_paths:
-            dir_path = os.path.dirname(out_path)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
-
         total_texts = len(texts)
         LOGGER.info(
             f"Generating {total_texts} audio(s) with voice cloning (batch_size={batch_size})..."
         )
 
+        # Batch similar-length lines together: a batch runs as long as its
+        # longest item, so mixing short and long lines wastes compute on padding
+        order = sorted(range(total_texts), key=lambda i: len(texts[i]))
+        results: List[Any] = [None] * total_texts
+        sr = self.sr
+
         try:
             # Process in batches to avoid CUDA OOM
             for batch_start in range(0, total_texts, batch_size):
                 batch_end = min(batch_start + batch_size, total_texts)
-                batch_texts = texts[batch_start:batch_end]
-                batch_paths = out_paths[batch_start:batch_end]
+                batch_order = order[batch_start:batch_end]
+                batch_texts = [texts[i] for i in batch_order]
                 batch_num = batch_start // batch_size + 1
                 total_batches = (total_texts + batch_size - 1) // batch_size
 
@@ -209,29 +264,57 @@ class Qwen3TTSWrapper:
                     voice_clone_prompt=self._voice_clone_prompt,
                 )
 
-                # Save each audio to its respective file
-                for i, out_path in enumerate(batch_paths):
-                    audio_data = wavs[i]
-                    global_idx = batch_start + i
-                    LOGGER.info(
-                        f"Audio {global_idx + 1}/{total_texts}: shape={audio_data.shape}, "
-                        f"duration={len(audio_data) / sr:.2f}s, sr={sr}"
-                    )
-                    sf.write(out_path, audio_data, sr)
-                    LOGGER.info(
-                        f"Audio {global_idx + 1}/{total_texts} saved to {out_path}"
+                for i, global_idx in enumerate(batch_order):
+                    audio_data = np.asarray(wavs[i], dtype=np.float32)
+                    LOGGER.debug(
+                        "Audio %d/%d: shape=%s, duration=%.2fs, sr=%d",
+                        global_idx + 1,
+                        total_texts,
+                        audio_data.shape,
+                        len(audio_data) / sr,
+                        sr,
                     )
+                    results[global_idx] = audio_data
 
                 # Clear CUDA cache after each batch to free memory
                 if torch.cuda.is_available():
                     torch.cuda.empty_cache()
 
-            LOGGER.info(f"Successfully generated {total_texts} audio file(s)")
+            LOGGER.info(f"Successfully generated {total_texts} audio(s)")
+            return results, sr
 
         except Exception as exc:
             LOGGER.exception("Failed to synthesize with Qwen3-TTS: %s", exc)
             raise
 
+    def synthesize_batch_to_files(
+        self, texts: List[str], out_paths: List[str], batch_size: int = 5
+    ):
+        """Generate audio for multiple texts and save each one to its own file.
+
+        Args:
+            texts: List of texts to synthesize
+            out_paths: List of output audio file paths (must match texts length)
+            batch_size: Number of texts to process per batch (default: 5)
+        """
+        import soundfile as sf
+
+        if len(texts) != len(out_paths):
+            raise ValueError(
+                f"Number of texts ({len(texts)}) must match number of out_paths ({len(out_paths)})"
+            )
+
+        # Create output directories
+        for out_path in out_paths:
+            dir_path = os.path.dirname(out_path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+
+        wavs, sr = self.synthesize_batch(texts, batch_size=batch_size)
+        for out_path, audio_data in zip(out_paths, wavs):
+            sf.write(out_path, audio_data, sr)
+            LOGGER.debug("Audio saved to %s", out_path)
+
 
 def generate_voice_reference(
     instruct: str,
@@ -262,15 +345,14 @@ def generate_voice_reference(
     try:
         from qwen_tts import Qwen3TTSModel
 
-        if device == "auto":
-            device = "cuda" if torch.cuda.is_available() else "cpu"
+        device = resolve_device(device)
 
         # Load VoiceDesign model
         LOGGER.info("Loading VoiceDesign model...")
         design_model = Qwen3TTSModel.from_pretrained(
             "Qwen/Qwen3-TTS-12Hz-1.7B-VoiceDesign",
             device_map=device,
-            dtype=torch.bfloat16 if device.startswith("cuda") else torch.float32,
+            dtype=_resolve_dtype("auto", device),
             attn_implementation="eager",
         )
 
@@ -316,6 +398,7 @@ def get_tts(
     reference_wav_path: Optional[str] = None,
     device: str = "auto",
     model_size: str = "1.7B",
+    precision: str = "auto",
 ):
     """Factory: return a TTS object with `synthesize_to_file(text, out_path)`.
 
@@ -326,6 +409,7 @@ def get_tts(
         reference_wav_path: Path to reference WAV file (REQUIRED)
         device: Device to use ('auto', 'cpu', 'cuda', 'cuda:0', etc.)
         model_size: Model size - "1.7B" or "0.6B" (default: "1.7B")
+        precision: Weights precision - "auto", "bf16", "fp16" or "fp32"
 
     Returns:
         Qwen3TTSWrapper instance
@@ -335,16 +419,10 @@ def get_tts(
     """
     lang_code = (lang or "es").lower()
 
-    # Map model_size to actual model name
-    if not model_name:
-        if model_size == "0.6B":
-            model_name = "Qwen/Qwen3-TTS-12Hz-0.6B-Base"
-        else:
-            model_name = "Qwen/Qwen3-TTS-12Hz-1.7B-Base"
-
     return Qwen3TTSWrapper(
         lang=lang_code,
-        model_name=model_name,
+        model_name=resolve_model_name(model_name, model_size),
         reference_wav_path=reference_wav_path,
         device=device,
+        precision=precision,
     )
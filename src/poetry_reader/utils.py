@@ -1,7 +1,144 @@
 """Utility functions shared across the poetry_reader package."""
 
+import copy
+import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+import yaml
+
+try:
+    # LibYAML-backed loader is several times faster when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed YAML configs keyed by path, validated against (mtime_ns, size, inode)
+_YAML_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], Any]]" = OrderedDict()
+_YAML_CACHE_MAX_ENTRIES = 32
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+def load_yaml(path) -> Any:
+    """Load a YAML file, reusing the parsed result while the file is unchanged.
+
+    Entries are invalidated when the file's mtime, size or inode changes.
+    A deep copy is returned so callers can mutate the result freely.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    key = os.fspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+    # Hand raw bytes to the loader so LibYAML decodes them in C
+    with open(key, "rb") as f:
+        data = yaml.load(f.read(), Loader=_YamlLoader)
+
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[key] = (stamp, data)
+        _YAML_CACHE.move_to_end(key)
+        while len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+            _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)
+
+
+# Keys every Drive-backed command reads from drive_config.yaml
+_DRIVE_CONFIG_REQUIRED = {
+    "google_drive": ("credentials_file", "client_secrets"),
+}
+_DRIVE_PROCESSING_DEFAULTS = {
+    "max_retries": 3,
+    "retry_delay_seconds": 5.0,
+    "max_workers": 8,
+    "upload_concurrency": 1,
+}
+
+
+def load_drive_config(path, required: Iterable[str] = ()) -> Dict[str, Any]:
+    """Load drive_config.yaml and validate it once, up front.
+
+    Missing required keys are reported together instead of surfacing later
+    as a bare KeyError, and optional `processing` settings get defaults.
+
+    Args:
+        path: Path to drive_config.yaml
+        required: Extra "section.key" entries the calling command reads,
+            e.g. "drive.excel_tracker_id"
+
+    Returns:
+        Parsed config dict
+
+    Raises:
+        ValueError: If the file is empty or required keys are missing
+    """
+    cfg = load_yaml(path)
+    if not isinstance(cfg, dict):
+        raise ValueError(f"Drive config is empty or malformed: {path}")
+
+    sections = {section: list(keys) for section, keys in _DRIVE_CONFIG_REQUIRED.items()}
+    for entry in required:
+        section, _, key = entry.partition(".")
+        sections.setdefault(section, []).append(key)
+
+    missing = []
+    for section, keys in sections.items():
+        values = cfg.get(section)
+        if not isinstance(values, dict):
+            missing.append(section)
+            continue
+        missing.extend(f"{section}.{key}" for key in keys if key not in values)
+    if missing:
+        raise ValueError(
+            f"Drive config {path} is missing required keys: {', '.join(missing)}"
+        )
+
+    # Older example configs nested `processing` under `drive`; honour it, with
+    # the top-level section taking precedence
+    legacy = (cfg.get("drive") or {}).get("processing") or {}
+    processing = cfg.get("processing") or {}
+    cfg["processing"] = _DRIVE_PROCESSING_DEFAULTS | legacy | processing
+    return cfg
+
+
+def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge two config dicts, with `override` taking precedence.
+
+    Nested dicts present on both sides are merged instead of replaced, so
+    e.g. `processing` settings from both configs survive. Inputs are not
+    mutated; an empty side short-circuits to the other one.
+
+    Args:
+        base: Lower-priority config
+        override: Higher-priority config
+
+    Returns:
+        Merged config dict
+    """
+    if not base:
+        return override or {}
+    if not override:
+        return base
+
+    merged = base | override
+    for key, value in override.items():
+        base_value = base.get(key)
+        if isinstance(base_value, dict) and isinstance(value, dict):
+            merged[key] = deep_merge(base_value, value)
+    return merged
 
 
 def parse_markdown_file(file_path: str) -> Dict[str, Any]:
@@ -55,6 +192,18 @@ def parse_markdown_file(file_path: str) -> Dict[str, Any]:
     }
 
 
+_TITLE_KEYS = ("titulo", "título", "title")
+_AUTHOR_KEYS = ("autor", "author")
+
+
+def _header_field(line: str) -> Tuple[Optional[str], str]:
+    """Split a 'Key: value' line into (lowercased key, stripped value)."""
+    if ":" not in line:
+        return None, ""
+    key, val = line.split(":", 1)
+    return key.strip().lower(), val.strip()
+
+
 def parse_md_file(path: str) -> Tuple[str, str, str]:
     """Parse a markdown file with the expected format:
     First non-empty line: starts with 'Titulo:' or 'Título:' or 'Title:' -> title
@@ -63,65 +212,60 @@ def parse_md_file(path: str) -> Tuple[str, str, str]:
 
     Returns (title, author, content_str).
     """
-    with open(path, "r", encoding="utf-8") as f:
-        lines = [line.rstrip("\n\r") for line in f.readlines()]
-
-    stripped = [ln.strip() for ln in lines]
-    non_empty = [ln for ln in stripped if ln != ""]
-
     title = None
     author = None
+    # Headers found anywhere in the first four lines, used when the first two
+    # non-empty lines are not the expected ones
+    fallback_title = None
+    fallback_author = None
 
-    if len(non_empty) >= 1:
-        first = non_empty[0]
-        if ":" in first:
-            key, val = first.split(":", 1)
-            if key.strip().lower() in ("titulo", "título", "title"):
-                title = val.strip()
-
-    if len(non_empty) >= 2:
-        second = non_empty[1]
-        if ":" in second:
-            key, val = second.split(":", 1)
-            if key.strip().lower() in ("autor", "author"):
-                author = val.strip()
-
-    if title is None or author is None:
-        for ln in stripped[:4]:
-            if ln and ":" in ln:
-                key, val = ln.split(":", 1)
-                k = key.strip().lower()
-                if title is None and k in ("titulo", "título", "title"):
-                    title = val.strip()
-                if author is None and k in ("autor", "author"):
-                    author = val.strip()
-
-    start_idx = 0
+    lines = []
+    non_empty = 0
     header_count = 0
-    for i, ln in enumerate(lines):
-        if ln.strip() == "":
-            continue
-        if ":" in ln and header_count < 2:
-            header_count += 1
-            start_idx = i + 1
-            continue
-        if header_count >= 2:
-            start_idx = i
-            break
-    if header_count < 2:
-        count = 0
-        for i, ln in enumerate(lines):
-            if ln.strip() != "":
-                count += 1
-                if count >= 2:
+    start_idx = 0
+    body_idx = None  # first non-empty line after two headers
+    second_line_end = None  # index right after the second non-empty line
+
+    with open(path, "r", encoding="utf-8") as f:
+        for i, raw in enumerate(f):
+            ln = raw.rstrip("\n\r")
+            lines.append(ln)
+            if not ln.strip():
+                continue
+            non_empty += 1
+            key, val = _header_field(ln)
+
+            if non_empty == 1 and key in _TITLE_KEYS:
+                title = val
+            elif non_empty == 2:
+                if key in _AUTHOR_KEYS:
+                    author = val
+                second_line_end = i + 1
+
+            if i < 4:
+                if fallback_title is None and key in _TITLE_KEYS:
+                    fallback_title = val
+                if fallback_author is None and key in _AUTHOR_KEYS:
+                    fallback_author = val
+
+            if body_idx is None:
+                if key is not None and header_count < 2:
+                    header_count += 1
                     start_idx = i + 1
-                    break
+                elif header_count >= 2:
+                    body_idx = i
+
+    if title is None:
+        title = fallback_title
+    if author is None:
+        author = fallback_author
 
-    content_lines = lines[start_idx:]
-    while content_lines and content_lines[0].strip() == "":
-        content_lines = content_lines[1:]
+    if body_idx is not None:
+        start_idx = body_idx
+    elif header_count < 2 and second_line_end is not None:
+        start_idx = second_line_end
 
-    content = "\n".join(content_lines).strip()
+    content = "\n".join(lines[start_idx:]).strip()
 
     if not title:
         title = Path(path).stem
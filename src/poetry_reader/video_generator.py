@@ -337,6 +337,8 @@ def create_video_with_subtitles(
             big_width = int(resolution[0] * zoom_factor)
             big_height = int(resolution[1] * zoom_factor)
             img_resized = img.resize((big_width, big_height), Image.Resampling.LANCZOS)
+            # Convert once; each frame is then a slice view instead of a crop+copy
+            big_arr = np.asarray(img_resized)
 
             def make_frame(t):
                 # Slowly pan upward over the duration
@@ -344,15 +346,10 @@ def create_video_with_subtitles(
                 # Start at bottom, move to top
                 y_offset = int((big_height - resolution[1]) * (1 - progress))
                 x_offset = (big_width - resolution[0]) // 2  # Center horizontally
-                cropped = img_resized.crop(
-                    (
-                        x_offset,
-                        y_offset,
-                        x_offset + resolution[0],
-                        y_offset + resolution[1],
-                    )
-                )
-                return np.array(cropped)
+                return big_arr[
+                    y_offset : y_offset + resolution[1],
+                    x_offset : x_offset + resolution[0],
+                ]
 
             bg = VideoClip(make_frame, duration=duration)
         else:
@@ -368,20 +365,20 @@ def create_video_with_subtitles(
                 zoom_factor=zoom_factor,
                 pan_direction="up",
             )
+            # Convert once; each frame is then a slice view instead of a crop+copy
+            big_arr = np.asarray(big_img)
+            width, height = resolution
+            big_height, big_width = big_arr.shape[:2]
 
             def make_frame(t):
                 # Slowly pan upward over the duration
                 progress = t / duration
-                width, height = resolution
-                big_width = int(width * zoom_factor)
-                big_height = int(height * zoom_factor)
                 # Start at bottom, move to top
                 y_offset = int((big_height - height) * (1 - progress))
                 x_offset = (big_width - width) // 2  # Center horizontally
-                cropped = big_img.crop(
-                    (x_offset, y_offset, x_offset + width, y_offset + height)
-                )
-                return np.array(cropped)
+                return big_arr[
+                    y_offset : y_offset + height, x_offset : x_offset + width
+                ]
 
             bg = VideoClip(make_frame, duration=duration)
         else:
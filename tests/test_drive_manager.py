@@ -0,0 +1,104 @@
+"""Tests for DriveManager."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+from pydrive2.files import ApiRequestError
+
+from poetry_reader.drive.manager import DriveManager, DriveManagerError
+
+
+class _FakeRequest:
+    def __init__(self, title, barrier, seen):
+        self.title = title
+        self.barrier = barrier
+        self.seen = seen
+
+    def next_chunk(self, http=None):
+        # Hold every worker here so the uploads really overlap
+        self.barrier.wait()
+        self.seen.append((threading.get_ident(), http))
+        return None, {"id": f"id-{self.title}"}
+
+
+class _FakeFiles:
+    def __init__(self, barrier, seen):
+        self.barrier = barrier
+        self.seen = seen
+
+    def insert(self, body, media_body):
+        return _FakeRequest(body["title"], self.barrier, self.seen)
+
+
+class _FakeService:
+    def __init__(self, barrier, seen):
+        self._files = _FakeFiles(barrier, seen)
+
+    def files(self):
+        return self._files
+
+
+def test_concurrent_uploads_use_one_http_per_thread(tmp_path):
+    workers = 3
+    seen = []
+    barrier = threading.Barrier(workers, timeout=10)
+    auth = SimpleNamespace(
+        service=_FakeService(barrier, seen),
+        http=object(),
+        thread_local=threading.local(),
+        Get_Http_Object=object,
+    )
+    manager = DriveManager(SimpleNamespace(auth=auth), max_workers=workers)
+
+    jobs = []
+    for i in range(workers):
+        path = tmp_path / f"video{i}.mp4"
+        path.write_bytes(b"data")
+        jobs.append((str(path), "folder", path.name))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        uploaded = list(executor.map(lambda job: manager.upload_file(*job), jobs))
+
+    assert uploaded == [f"id-{name}" for _, _, name in jobs]
+    threads = {thread for thread, _ in seen}
+    https = {id(http) for _, http in seen}
+    assert len(threads) == workers
+    assert len(https) == workers
+    assert auth.http not in [http for _, http in seen]
+
+
+def _api_request_error(status):
+    content = json.dumps({"error": {"code": status, "message": "error"}}).encode()
+    return ApiRequestError(HttpError(httplib2.Response({"status": status}), content))
+
+
+def test_pydrive2_not_found_is_not_retried():
+    manager = DriveManager(SimpleNamespace(auth=None), max_retries=3, retry_delay=0)
+    calls = []
+
+    def _operation():
+        calls.append(1)
+        raise _api_request_error(404)
+
+    with pytest.raises(DriveManagerError):
+        manager._with_retry(_operation, "fetching", "Failed")
+    assert len(calls) == 1
+
+
+def test_pydrive2_server_error_is_retried():
+    manager = DriveManager(SimpleNamespace(auth=None), max_retries=3, retry_delay=0)
+    calls = []
+
+    def _operation():
+        calls.append(1)
+        if len(calls) < 3:
+            raise _api_request_error(503)
+        return "ok"
+
+    assert manager._with_retry(_operation, "fetching", "Failed") == "ok"
+    assert len(calls) == 3
@@ -0,0 +1,33 @@
+"""Tests for generate_videos helpers."""
+
+from poetry_reader.generate_videos import detect_language, normalize_text_for_tts
+
+
+def test_detect_language_english_with_loanword():
+    text = (
+        "I went to the café on the corner this morning and ordered a black "
+        "coffee while reading the newspaper, then walked home slowly."
+    )
+    assert detect_language(text) == "en"
+
+
+def test_detect_language_spanish():
+    text = (
+        "Volverán las oscuras golondrinas en tu balcón sus nidos a colgar, "
+        "y otra vez con el ala a sus cristales jugando llamarán."
+    )
+    assert detect_language(text) == "es"
+
+
+def test_detect_language_short_english_with_one_accent():
+    assert (
+        detect_language("piñata party tonight at the bar with friends and family")
+        == "en"
+    )
+
+
+def test_normalize_text_for_tts_keeps_only_enye():
+    assert normalize_text_for_tts("Años de canción, ÑANDÚ, São") == (
+        "Años de cancion, ÑANDU, Sao"
+    )
+    assert normalize_text_for_tts("a\x00b\x01c") == "a\x00b\x01c"
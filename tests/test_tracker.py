@@ -0,0 +1,72 @@
+"""Tests for ExcelTracker."""
+
+import pandas as pd
+
+from poetry_reader.drive.tracker import ExcelTracker
+
+
+def _tracker(hecho) -> ExcelTracker:
+    tracker = ExcelTracker("unused.xlsx")
+    tracker.df = pd.DataFrame(
+        {"Archivo": [f"p{i}.md" for i in range(len(hecho))], "Hecho": hecho}
+    )
+    tracker.df["error"] = None
+    return tracker
+
+
+def test_normalize_hecho_mixed_column():
+    tracker = _tracker(["Sí", "no", "1", "2", "0.5", 1, 0, 2.5, None, True, False])
+    tracker._normalize_hecho_column()
+    assert tracker.df["Hecho"].tolist() == [
+        True,
+        False,
+        True,
+        False,
+        False,
+        True,
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_normalize_hecho_nullable_boolean_column():
+    tracker = _tracker(pd.array([True, None, False], dtype="boolean"))
+    tracker._normalize_hecho_column()
+    tracker._recount()
+    assert tracker.df["Hecho"].tolist() == [True, False, False]
+    assert tracker.get_pending_files() == [
+        {"index": 1, "filename": "p1.md"},
+        {"index": 2, "filename": "p2.md"},
+    ]
+
+
+def test_snapshot_round_trip_keeps_datetime_column(tmp_path):
+    excel_path = tmp_path / "tracker.xlsx"
+    pd.DataFrame(
+        {
+            "Archivo": ["a.md", "b.md"],
+            "Hecho": [False, True],
+            "Publicado": pd.to_datetime(["2024-01-02", "2024-03-04"]),
+        }
+    ).to_excel(excel_path, index=False, engine="openpyxl")
+
+    first = ExcelTracker(str(excel_path))
+    first.load()
+    first.save(force=True)
+    assert first.snapshot_path.exists()
+
+    # Served from the sidecar, then written back to the xlsx
+    second = ExcelTracker(str(excel_path))
+    second.load()
+    assert pd.api.types.is_datetime64_any_dtype(second.df["Publicado"])
+    second.mark_processed(0, "video-id")
+    second.save()
+
+    saved = pd.read_excel(excel_path, engine="openpyxl")
+    assert pd.api.types.is_datetime64_any_dtype(saved["Publicado"])
+    assert saved["Publicado"].tolist() == list(
+        pd.to_datetime(["2024-01-02", "2024-03-04"])
+    )
@@ -0,0 +1,31 @@
+"""Tests for utils."""
+
+import pytest
+import yaml
+
+from poetry_reader.utils import load_drive_config
+
+
+def _write(tmp_path, cfg):
+    path = tmp_path / "drive_config.yaml"
+    path.write_text(yaml.safe_dump(cfg))
+    return path
+
+
+def test_load_drive_config_defaults_match_drive_manager(tmp_path):
+    path = _write(
+        tmp_path, {"google_drive": {"credentials_file": "c", "client_secrets": "s"}}
+    )
+    assert load_drive_config(path)["processing"]["retry_delay_seconds"] == 5.0
+
+
+def test_load_drive_config_reports_keys_the_command_reads(tmp_path):
+    path = _write(
+        tmp_path,
+        {
+            "google_drive": {"credentials_file": "c", "client_secrets": "s"},
+            "drive": {"videos_output_folder_id": "v"},
+        },
+    )
+    with pytest.raises(ValueError, match="drive.excel_tracker_id, local"):
+        load_drive_config(path, ["drive.excel_tracker_id", "local.cache_dir"])